@@ -8,6 +8,7 @@ Speeds up parallel operations like:
 """
 
 import asyncio
+import re
 import aiohttp
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Any, Optional, Callable
@@ -15,6 +16,13 @@ import time
 from functools import wraps
 
 
+# Precompiled RSS parsing patterns
+_ITEM_RE = re.compile(r'<item>(.*?)</item>', re.S | re.I)
+_TITLE_RE = re.compile(r'<title>(.*?)</title>', re.S | re.I)
+_DESC_RE = re.compile(r'<description>(.*?)</description>', re.S | re.I)
+_TAG_RE = re.compile('<.*?>')
+
+
 # Global thread pool for CPU-bound tasks
 _thread_pool = ThreadPoolExecutor(max_workers=10)
 
@@ -72,22 +80,21 @@ async def fetch_multiple_rss_feeds_async(feed_urls: List[tuple]) -> Dict[str, Li
     results = {}
     
     async with aiohttp.ClientSession(headers={'User-Agent': 'CryptoTrader/1.0'}) as session:
-        tasks = []
-        for name, url in feed_urls:
-            tasks.append((name, fetch_url_async(session, url)))
+        # Fetch all feeds in parallel (wall time = slowest feed, not the sum)
+        contents = await asyncio.gather(
+            *(fetch_url_async(session, url) for _, url in feed_urls),
+            return_exceptions=True
+        )
         
-        # Fetch all feeds in parallel
-        for name, task in zip([n for n, _ in feed_urls], [t for _, t in tasks]):
-            content = await task
-            if content:
+        for (name, _), content in zip(feed_urls, contents):
+            if content and not isinstance(content, BaseException):
                 # Parse RSS (simple regex parsing)
-                import re
                 items = []
-                for block in re.findall(r'<item>(.*?)</item>', content, re.S | re.I):
-                    title_m = re.search(r'<title>(.*?)</title>', block, re.S | re.I)
-                    desc_m = re.search(r'<description>(.*?)</description>', block, re.S | re.I)
-                    title = re.sub('<.*?>', '', title_m.group(1)).strip() if title_m else ''
-                    desc = re.sub('<.*?>', '', desc_m.group(1)).strip() if desc_m else ''
+                for block in _ITEM_RE.findall(content):
+                    title_m = _TITLE_RE.search(block)
+                    desc_m = _DESC_RE.search(block)
+                    title = _TAG_RE.sub('', title_m.group(1)).strip() if title_m else ''
+                    desc = _TAG_RE.sub('', desc_m.group(1)).strip() if desc_m else ''
                     if title or desc:
                         items.append({'title': title, 'description': desc})
                 results[name] = items[:10]  # Limit to 10 per feed
@@ -130,11 +137,13 @@ def analyze_symbol_with_threading(
         signal = calculate_signal_func(sentiment_score, news_count, market_data, symbol_name, articles)
         
         if signal and signal['confidence'] > 0.3:
-            # Extract indicator signals for learning
-            indicators_signals = {}
-            for ind_name, ind_data in market_data['indicators'].items():
-                if isinstance(ind_data, dict) and 'signal' in ind_data:
-                    indicators_signals[ind_name] = ind_data['signal']
+            # Indicator signals for learning (precomputed by get_market_data when available)
+            indicators_signals = market_data.get('signals')
+            if indicators_signals is None:
+                indicators_signals = {}
+                for ind_name, ind_data in market_data['indicators'].items():
+                    if 'signal' in ind_data:
+                        indicators_signals[ind_name] = ind_data['signal']
             
             return {
                 'symbol': symbol_name,
@@ -10,6 +10,9 @@ from typing import Dict, List, Optional
 import pytz
 import statistics
 
+from config import TRADE_LOG_FILE
+from trade_log import load_trade_log
+
 class Backtester:
     """
     Backtest trading signals against historical data
@@ -21,7 +24,7 @@ class Backtester:
     - Strategy comparison
     """
     
-    def __init__(self, trade_log_file: str = "trade_log.json",
+    def __init__(self, trade_log_file: str = TRADE_LOG_FILE,
                  learning_state_file: str = "learning_state.json"):
         self.trade_log_file = trade_log_file
         self.learning_state_file = learning_state_file
@@ -30,13 +33,10 @@ class Backtester:
     
     def _load_trades(self) -> List[Dict]:
         """Load historical trades"""
-        if os.path.exists(self.trade_log_file):
-            try:
-                with open(self.trade_log_file, 'r') as f:
-                    return json.load(f)
-            except:
-                pass
-        return []
+        try:
+            return load_trade_log(self.trade_log_file)
+        except (OSError, ValueError):
+            return []
     
     def _load_learning_state(self) -> Dict:
         """Load learning state"""
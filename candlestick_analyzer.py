@@ -6,7 +6,20 @@ Uses TA-Lib for pattern detection (no additional API calls needed)
 import pandas as pd
 import numpy as np
 import talib
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Tuple, TypedDict
+
+
+class IndicatorResult(TypedDict, total=False):
+    """One entry of get_all_candlestick_indicators() - always a plain dict.
+    Consumers may rely on that and skip per-entry type checks.
+    """
+    signal: float  # -1..1, 0 for non-directional indicators (ATR)
+    confidence: float
+    description: str
+    patterns: List[str]
+    value: float
+    percent: float
+    timeframe: str
 
 
 def calculate_atr_for_stops(df: pd.DataFrame, period: int = 14) -> Dict[str, Any]:
@@ -234,7 +247,7 @@ def get_candlestick_analysis(df: pd.DataFrame) -> Dict[str, Any]:
     }
 
 
-def get_all_candlestick_indicators(df: pd.DataFrame) -> Dict[str, Any]:
+def get_all_candlestick_indicators(df: pd.DataFrame) -> Dict[str, IndicatorResult]:
     """
     Wrapper to match the interface expected by main.py
     Returns candlestick analysis in the same format as technical_indicators
@@ -71,7 +71,7 @@ ML_MIN_CONFIDENCE = 0.60
 ML_RETRAIN_THRESHOLD = 20  # Retrain after 20 completed trades
 
 # ==================== FILE PATHS ====================
-TRADE_LOG_FILE = 'trade_log.json'
+TRADE_LOG_FILE = 'trade_log.jsonl'  # JSON Lines, one trade per line
 DAILY_RISK_FILE = 'daily_risk.json'
 
 # ==================== LLM API LIMITS (FREE TIER) ====================
@@ -111,6 +111,16 @@ GROQ_LIMITS = {
     }
 }
 
+# Market analysis model selection (CryptoMarketAnalyzer.analyze_with_llm)
+# Output is ~5 short structured lines; the provider's configured model (GROQ_MODEL,
+# small by default) handles it unless high_reasoning routes ambiguous cases up
+LLM_HIGH_REASONING_MODEL = 'llama-3.3-70b-versatile'  # Used only when high_reasoning=True
+LLM_ANALYSIS_MAX_TOKENS = 200
+LLM_AMBIGUOUS_SENTIMENT = 0.2  # |sentiment| below this is routed to the large model
+# Skip the LLM call when technicals and sentiment already decide the trade
+LLM_SKIP_AGREEMENT = 0.7  # Both scores beyond this (same sign) = strong consensus
+LLM_SKIP_FLAT = 0.1  # Both scores within this = flat market, nothing to trade
+
 # Default safe daily budget if model not found (conservative)
 DEFAULT_DAILY_BUDGET = 1000
 DEFAULT_HOURLY_BUDGET = 100
@@ -118,6 +128,7 @@ DEFAULT_MINUTE_BUDGET = 10
 
 # Buffer percentage (use only this % of limit to be safe)
 RATE_LIMIT_BUFFER = 0.85  # Use only 85% of stated limits
+LLM_MAX_CONCURRENT_REQUESTS = 8  # Upstream requests in flight at once (per client)
 
 # ==================== LEARNING SYSTEM PARAMETERS ====================
 
@@ -153,8 +164,9 @@ POOR_WIN_RATE = 0.40  # Below 40% triggers aggressive adjustment
 # ==================== CACHE & STORAGE ====================
 
 LEARNING_STATE_FILE = 'learning_state.json'
-TRADE_LOG_FILE = 'trade_log.json'
+TRADE_LOG_FILE = 'trade_log.jsonl'  # JSON Lines, one trade per line
 NEWS_CACHE_FILE = 'news_cache.json'
+MARKET_DATA_CACHE_FILE = 'market_data_cache.json'  # Computed market data, reused within a candle
 LLM_USAGE_FILE = 'llm_usage.json'
 
 NEWS_CACHE_MAX_AGE_HOURS = 12  # Cache news analysis for 12 hours
@@ -3,12 +3,364 @@ Crypto Market Analyzer - LLM-Powered Analysis Layer
 Inspired by AI-Trader's agent-based approach with our proven technical indicators
 """
 
+import atexit
+import heapq
 import json
+import math
 import os
-from typing import Dict, Any, List, Optional
+import time
+from collections import OrderedDict, deque
+from hashlib import blake2b
+from itertools import islice
+from operator import itemgetter
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
 from datetime import datetime
+from threading import Lock
 
-from config import ADAPTIVE_LIMITS
+import numpy as np
+
+# Optional fast JSON serializer for learning state persistence
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from numba_compat import njit
+
+if TYPE_CHECKING:
+    from candlestick_analyzer import IndicatorResult
+from config import (
+    ADAPTIVE_LIMITS,
+    LLM_HIGH_REASONING_MODEL,
+    LLM_ANALYSIS_MAX_TOKENS,
+    LLM_AMBIGUOUS_SENTIMENT,
+    LLM_SKIP_AGREEMENT,
+    LLM_SKIP_FLAT,
+)
+
+# Invariant system message for market analysis (shared, never mutate)
+_SYSTEM_MSG = {"role": "system", "content": "You are an expert cryptocurrency trader."}
+
+# Market analysis prompt skeleton - filled with str.format_map per call
+_ANALYSIS_PROMPT_TEMPLATE = """Analyzing {symbol}.
+
+CURRENT MARKET DATA:
+Price: ${price}
+Volatility: {volatility_pct}%
+ATR: {atr_pct}%
+
+CANDLESTICK PATTERN ANALYSIS:
+Signal: {signals}
+Patterns Detected: {patterns}
+Confidence: {pattern_confidence_pct}%
+Description: {description}
+
+SENTIMENT ANALYSIS:
+Score: {sentiment} (-1 to +1 scale)
+News Count: {n_news} articles
+Recent Headlines: {headlines}
+
+TASK:
+Analyze this data and provide:
+1. Trading Direction (LONG/SHORT/NEUTRAL)
+2. Confidence Level (0-100%)
+3. Key Reasoning (2-3 sentences)
+4. Risk Assessment (LOW/MEDIUM/HIGH)
+5. Recommended holding period (HOURS/DAYS/WEEK)
+
+Format your response as:
+DIRECTION: [LONG/SHORT/NEUTRAL]
+CONFIDENCE: [0-100]
+REASONING: [Your analysis]
+RISK: [LOW/MEDIUM/HIGH]
+TIMEFRAME: [HOURS/DAYS/WEEK]"""
+
+# Bound fixed-precision formatters for the numeric prompt fields
+_FMT0 = "{:.0f}".format
+_FMT1 = "{:.1f}".format
+_FMT2 = "{:.2f}".format
+
+
+def _fmt_price(price: float) -> str:
+    """Fixed-point price with ~6 significant digits (no exponent for sub-cent coins)"""
+    if not price or not math.isfinite(price):
+        return _FMT2(price)
+    decimals = max(2, 5 - math.floor(math.log10(abs(price))))
+    return f"{price:.{decimals}f}"
+
+
+# Tool schema for structured trade decisions - the model emits schema-conformant
+# arguments instead of free text that has to be regex-parsed
+_TRADE_DECISION_TOOL = {
+    "type": "function",
+    "function": {
+        "name": "emit_trade_decision",
+        "description": "Report the trading decision for the analyzed symbol",
+        "parameters": {
+            "type": "object",
+            "required": ["direction", "confidence", "reasoning", "risk", "timeframe"],
+            "properties": {
+                "direction": {"type": "string", "enum": ["LONG", "SHORT", "NEUTRAL"]},
+                "confidence": {"type": "integer", "minimum": 0, "maximum": 100},
+                "reasoning": {"type": "string"},
+                "risk": {"type": "string", "enum": ["LOW", "MEDIUM", "HIGH"]},
+                "timeframe": {"type": "string", "enum": ["HOURS", "DAYS", "WEEK"]}
+            }
+        }
+    }
+}
+_TRADE_DECISION_CHOICE = {"type": "function", "function": {"name": "emit_trade_decision"}}
+
+# Allowed values for a valid trade decision (mirrors the tool schema)
+_VALID_DIRECTIONS = frozenset(('LONG', 'SHORT', 'NEUTRAL'))
+_VALID_RISKS = frozenset(('LOW', 'MEDIUM', 'HIGH'))
+_VALID_TIMEFRAMES = frozenset(('HOURS', 'DAYS', 'WEEK'))
+
+# Defaults for the optional decision fields (copied per parse, never mutated).
+# Direction and confidence have no defaults - they must come from the model.
+_DEFAULT_PARSED = {'reasoning': '', 'risk': 'MEDIUM', 'timeframe': 'HOURS'}
+
+# Keys of the text response format (fallback when the provider ignores tool calls)
+_TEXT_FIELDS = frozenset(('DIRECTION', 'CONFIDENCE', 'REASONING', 'RISK', 'TIMEFRAME'))
+
+# Read-only template for the flat-market fast path in combine_analyses (callers get a copy)
+_FLAT_MARKET_EPS = 0.05
+_NEUTRAL_RESULT = MappingProxyType({
+    'final_score': 0.0,
+    'confidence': 0.0,
+    'method': 'flat_market',
+    'direction': 'NEUTRAL',
+})
+
+
+def _split_text_fields(response: str) -> Dict[str, str]:
+    """Split a 'KEY: value' response into raw field values in a single pass over its lines.
+    REASONING may continue over several lines until the next known key.
+    """
+    fields = {}
+    current = None
+    for line in response.splitlines():
+        head, sep, value = line.partition(':')
+        words = head.replace('*', ' ').split() if sep else None
+        key = words[-1].upper() if words else ''
+        if key in _TEXT_FIELDS:
+            if key in fields:
+                current = None  # First occurrence wins
+                continue
+            current = key
+            fields[key] = value.replace('*', ' ').strip()
+        elif current == 'REASONING':
+            fields[current] += '\n' + line.strip()
+    return fields
+
+
+def _first_word(value: str) -> str:
+    """Leading alphabetic word of a field value, upper-cased ('' if none)"""
+    end = 0
+    while end < len(value) and value[end].isalpha():
+        end += 1
+    return value[:end].upper()
+
+
+def _leading_int(value: str) -> Optional[int]:
+    """Leading integer of a field value ('72%' -> 72), or None"""
+    end = 0
+    while end < len(value) and value[end].isdigit():
+        end += 1
+    return int(value[:end]) if end else None
+
+
+def _validate_trade_decision(decision: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Validate a parsed trade decision against the schema.
+    Returns the normalized decision, or None if any field is invalid.
+    """
+    try:
+        direction = str(decision['direction']).upper()
+        confidence = int(decision['confidence'])
+        reasoning = str(decision.get('reasoning', '')).strip()[:300]
+        risk = str(decision.get('risk', 'MEDIUM')).upper()
+        timeframe = str(decision.get('timeframe', 'HOURS')).upper()
+    except (KeyError, ValueError, TypeError):
+        return None
+    
+    if (direction not in _VALID_DIRECTIONS or not 0 <= confidence <= 100
+            or risk not in _VALID_RISKS or timeframe not in _VALID_TIMEFRAMES):
+        return None
+    
+    return {
+        'direction': direction,
+        'confidence': confidence,
+        'reasoning': reasoning,
+        'risk': risk,
+        'timeframe': timeframe
+    }
+
+# Upper-cased indicator names, computed once per name
+_UPPER_NAMES: Dict[str, str] = {}
+
+
+def _upper_name(name: str) -> str:
+    """Cached name.upper() for indicator labels"""
+    upper = _UPPER_NAMES.get(name)
+    if upper is None:
+        upper = _UPPER_NAMES[name] = name.upper()
+    return upper
+
+
+def summarize_indicator_signals(indicators: Dict[str, 'IndicatorResult']):
+    """Partition indicator output once, at the producer.
+    Returns (signals, strong_signals): {name: signal} for every entry carrying a
+    signal, and the prompt labels ('CANDLESTICK: BULLISH') for full-strength ones.
+    Every entry is an IndicatorResult dict, so no per-entry type check is needed.
+    """
+    signals = {}
+    strong_signals = []
+    for name, data in indicators.items():
+        signal = data.get('signal')
+        if signal is not None:
+            signals[name] = signal
+            if signal == 1 or signal == -1:
+                strong_signals.append(f"{_upper_name(name)}: {'BULLISH' if signal > 0 else 'BEARISH'}")
+    return signals, tuple(strong_signals)
+
+
+@njit("float64(float64, float64, float64)", cache=True)
+def _update_ema(prev: float, new: float, alpha: float) -> float:
+    """Exponential moving average step; seeds with the first value when prev is 0"""
+    if prev == 0.0:
+        return new
+    return (1.0 - alpha) * prev + alpha * new
+
+
+@njit("Tuple((float64, int64))(float64, float64, float64)", cache=True)
+def _tp_factor_step(avg_tp_precision: float, overshoot: float, current: float):
+    """TP adjustment ladder. Returns (new_factor, reason_index into _TP_REASONS)"""
+    if avg_tp_precision < 0.7:
+        # TPs are too ambitious - reduce by the overshoot amount
+        return max(0.6, 1.0 - overshoot * 0.8), 0
+    if avg_tp_precision < 0.85:
+        # TPs slightly too far - minor reduction
+        return max(0.75, current - 0.05), 1
+    if avg_tp_precision > 1.2:
+        # TPs too conservative - we're hitting them too easily
+        return min(1.2, current + 0.05), 2
+    # TPs are well-calibrated
+    return current, 3
+
+
+@njit("UniTuple(float64, 2)(float64[:])", cache=True)
+def _perf_reduce(profits: np.ndarray):
+    """(win_rate, avg_profit) of a profit array in one sequential pass (0.0, 0.0 if empty)"""
+    n = profits.shape[0]
+    if n == 0:
+        return 0.0, 0.0
+    total = 0.0
+    wins = 0
+    for i in range(n):
+        total += profits[i]
+        if profits[i] > 0.0:
+            wins += 1
+    return wins / n, total / n
+
+
+_TP_REASONS = (
+    "TPs too ambitious, reducing",
+    "TPs slightly high, adjusting",
+    "TPs too conservative, increasing",
+    "TP precision good",
+)
+
+
+def _clip(value, lo, hi):
+    """Clamp value into [lo, hi] with plain comparisons"""
+    return lo if value < lo else hi if value > hi else value
+
+
+# Indicator weight buckets, checked in order:
+# (min accuracy, min avg profit, profit must strictly exceed the minimum, multiplier, status)
+_WEIGHT_BUCKETS = (
+    (0.65, 0.0, True, 1.5, "⭐ BOOSTED"),  # Excellent - needs avg profit > 0
+    (0.55, 0.0, False, 1.2, "✅ GOOD"),  # Good - slight boost
+    (0.45, -math.inf, False, 1.0, "➖ NEUTRAL"),  # Keep base weight
+    (0.35, -math.inf, False, 0.7, "⚠️ WEAK"),  # Underperforming - reduce weight
+    (-math.inf, -math.inf, False, 0.3, "❌ POOR"),  # Heavily reduce
+)
+
+
+def _weight_bucket(accuracy: float, avg_profit: float):
+    """(weight multiplier, status) for an indicator's accuracy and average profit"""
+    for min_accuracy, min_profit, strict, multiplier, status in _WEIGHT_BUCKETS:
+        profit_ok = avg_profit > min_profit if strict else avg_profit >= min_profit
+        if accuracy >= min_accuracy and profit_ok:
+            return multiplier, status
+    return _WEIGHT_BUCKETS[-1][3:]
+
+
+class _MetricRing:
+    """Fixed-capacity float ring buffer with O(1) append and vectorized tail means.
+    Replaces unbounded per-trade metric lists; persisted as a float64 array in the .npz sidecar.
+    """
+    
+    def __init__(self, capacity: int = 256):
+        self.buf = np.empty(capacity, dtype=np.float64)
+        self.n = 0  # Valid entries
+        self.i = 0  # Next write slot
+    
+    def __len__(self):
+        return self.n
+    
+    def append(self, value: float):
+        self.buf[self.i] = value
+        self.i = (self.i + 1) % len(self.buf)
+        self.n = min(self.n + 1, len(self.buf))
+    
+    def extend(self, values):
+        for value in values:
+            self.append(value)
+    
+    def tail(self, k: int) -> np.ndarray:
+        """Last k values in chronological order"""
+        k = min(k, self.n)
+        idx = (self.i - k + np.arange(k)) % len(self.buf)
+        return self.buf[idx]
+    
+    def tail_mean(self, k: int) -> float:
+        """Mean of the last k values (0.0 if empty)"""
+        return float(self.tail(k).mean()) if self.n else 0.0
+    
+    def tolist(self) -> List[float]:
+        return self.tail(self.n).tolist()
+
+
+_BAR60 = '=' * 60  # Report separator
+
+# Adaptive parameter change log (JSONL), rotated past ~1MB
+_ADAPTIVE_LOG_PATH = os.path.join('logs', 'adaptive_changes.jsonl')
+_ADAPTIVE_LOG_MAX_BYTES = 1_000_000
+
+# Failure counters read together by _adjust_dynamic_parameters (one C-level call)
+_PREC_KEYS = itemgetter('entry_not_reached_count', 'sl_hit_early_count', 'tp_too_far_count',
+                        'wrong_direction_count', 'total_trades')
+
+# (lo, hi) bounds for _adjust_dynamic_parameters, unpacked once from ADAPTIVE_LIMITS
+_LIM_ERPS = tuple(ADAPTIVE_LIMITS['expected_return_per_sentiment'])
+_LIM_NIM = tuple(ADAPTIVE_LIMITS['news_impact_multiplier'])
+_LIM_MNB = tuple(ADAPTIVE_LIMITS['max_news_bonus'])
+_LIM_LEV = tuple(ADAPTIVE_LIMITS['dynamic_max_leverage'])
+_LIM_RISK = tuple(ADAPTIVE_LIMITS['daily_risk_limit'])
+_LIM_SL = tuple(ADAPTIVE_LIMITS['sl_adjustment_factor'])
+_LIM_TP = tuple(ADAPTIVE_LIMITS['tp_adjustment_factor'])
+
+# Parameters tuned (and logged) by _adjust_dynamic_parameters, in log order
+_DYNAMIC_KEY_NAMES = ('expected_return_per_sentiment', 'news_impact_multiplier', 'max_news_bonus',
+                      'dynamic_max_leverage', 'daily_risk_limit', 'sl_adjustment_factor',
+                      'tp_adjustment_factor')
+
+# Fixed-size record for the in-memory trade ring buffer
+_HIST_DTYPE = np.dtype([('ts', 'i8'), ('profit', 'f8')])
 
 class CryptoMarketAnalyzer:
     """
@@ -19,6 +371,14 @@ class CryptoMarketAnalyzer:
     """
     
     LEARNING_DATA_FILE = 'learning_state.json'
+    LEARNING_METRICS_FILE = 'learning_state.npz'  # Binary sidecar for the metric rings
+    HISTORY_SIZE = 50  # Trades kept in performance_history / ring buffer
+    INDICATOR_CAPACITY = 32  # Initial rows in the indicator table (grows on demand)
+    STRATEGY_WINDOW = 20  # Trades used by _adjust_strategy (running sums below)
+    DYNAMIC_WINDOW = 40  # Trades used by _adjust_dynamic_parameters (running sums below)
+    SAVE_INTERVAL_SECONDS = 30  # Minimum time between learning-state writes from learn_from_trade
+    LLM_CACHE_SIZE = 128  # Analyses kept for identical prompts
+    LLM_CACHE_TTL_SECONDS = 300  # Cached analyses expire after 5 minutes
     
     # Consecutive "no signals" adjustment constants
     # Tracks when bot outputs "no trade available" due to tight ML barriers
@@ -33,14 +393,47 @@ class CryptoMarketAnalyzer:
     MIN_CONFIDENCE_THRESHOLD = 0.2  # Don't lower confidence below 0.2
     MIN_TP_ADJUSTMENT = 0.6  # Don't reduce TP below 60%
     
-    def __init__(self, llm_client=None):
+    # Fixed attribute set - no per-instance __dict__ (every attribute is set in __init__)
+    __slots__ = (
+        'llm_client', 'model', 'max_tokens', 'high_reasoning',
+        'performance_history', 'precision_metrics', 'strategy_adjustments',
+        'last_optimization', 'optimization_interval',
+        '_hist', '_hist_n', '_hist_i',
+        '_win_sum', '_win_sum_sq', '_win_wins', '_dyn_sum', '_dyn_wins',
+        '_ind_index', '_ind_correct', '_ind_total', '_ind_profit', '_ind_accuracy',
+        '_dirty', '_last_save', '_llm_cache', '_llm_cache_lock', '_adaptive_log_fh',
+        '_last_adjust_total',
+    )
+    
+    def __init__(self, llm_client=None, model: Optional[str] = None,
+                 max_tokens: int = LLM_ANALYSIS_MAX_TOKENS, high_reasoning: bool = False):
         self.llm_client = llm_client
-        self.performance_history = []
-        self.indicator_performance = {}  # Track each indicator's accuracy
+        self.model = model  # None: each provider's configured model (e.g. GROQ_MODEL)
+        self.max_tokens = max_tokens
+        # When enabled, ambiguous setups (weak sentiment) go to the large model
+        self.high_reasoning = high_reasoning
+        self.performance_history = deque(maxlen=self.HISTORY_SIZE)  # O(1) eviction of oldest trade
+        # Ring buffer of (timestamp_ns, profit) mirroring performance_history for vectorized stats
+        self._hist = np.zeros(self.HISTORY_SIZE, dtype=_HIST_DTYPE)
+        self._hist_n = 0  # Valid entries
+        self._hist_i = 0  # Next write slot
+        # Running sums over the last STRATEGY_WINDOW profits (O(1) update per trade)
+        self._win_sum = 0.0
+        self._win_sum_sq = 0.0
+        self._win_wins = 0
+        # Same for the last DYNAMIC_WINDOW profits
+        self._dyn_sum = 0.0
+        self._dyn_wins = 0
+        # Per-indicator accuracy as a structure-of-arrays table (name -> row index)
+        self._ind_index: Dict[str, int] = {}
+        self._ind_correct = np.zeros(self.INDICATOR_CAPACITY, dtype=np.int64)
+        self._ind_total = np.zeros(self.INDICATOR_CAPACITY, dtype=np.int64)
+        self._ind_profit = np.zeros(self.INDICATOR_CAPACITY, dtype=np.float64)
+        self._ind_accuracy = np.full(self.INDICATOR_CAPACITY, 0.5)
         self.precision_metrics = {
-            'direction_accuracy': [],
-            'tp_precision': [],
-            'entry_timing': [],
+            'direction_accuracy': _MetricRing(),  # Bounded ring buffers (saved in the .npz sidecar)
+            'tp_precision': _MetricRing(),
+            'entry_timing': _MetricRing(),
             'avg_tp_overshoot': 0.0,  # How much TP is typically too far
             'avg_price_movement': 0.0,  # Actual average price movement
             # Track failure reasons
@@ -50,7 +443,7 @@ class CryptoMarketAnalyzer:
             'wrong_direction_count': 0,  # How often direction prediction was wrong
             'total_trades': 0,
             # Candlestick-specific metrics
-            'candlestick_accuracy': [],  # Track candlestick pattern accuracy
+            'candlestick_accuracy': _MetricRing(),  # Track candlestick pattern accuracy
             'pattern_success_rate': {},  # Track success rate per pattern type
             # Streak tracking for momentum
             'current_win_streak': 0,
@@ -84,6 +477,20 @@ class CryptoMarketAnalyzer:
         }
         self.last_optimization = datetime.now()
         self.optimization_interval = 20  # Optimize every 20 trades
+        self._last_adjust_total = -1  # total_trades seen by the last _adjust_dynamic_parameters run
+        
+        # Write throttling: learn_from_trade marks state dirty, saves at most every
+        # SAVE_INTERVAL_SECONDS, and anything pending is flushed at process exit
+        self._dirty = False
+        self._last_save = time.monotonic()
+        atexit.register(self._flush_learning_state)
+        
+        # LRU of recent analyses keyed on a prompt digest: digest -> (stored_at, analysis)
+        self._llm_cache: OrderedDict = OrderedDict()
+        self._llm_cache_lock = Lock()
+        
+        # Long-lived, line-buffered handle for the adaptive-changes log (opened lazily)
+        self._adaptive_log_fh = None
         
         # Load previous learning state if exists
         self._load_learning_state()
@@ -96,14 +503,28 @@ class CryptoMarketAnalyzer:
                     data = json.load(f)
                 
                 # Restore learning data
-                self.performance_history = data.get('performance_history', [])
-                self.indicator_performance = data.get('indicator_performance', {})
+                self.performance_history = deque(data.get('performance_history', []), maxlen=self.HISTORY_SIZE)
+                for t in self.performance_history:
+                    self._record_history(t['timestamp'], t['result'].get('profit', 0))
+                for indicator, perf in data.get('indicator_performance', {}).items():
+                    i = self._indicator_slot(indicator)
+                    self._ind_correct[i] = perf.get('correct', 0)
+                    self._ind_total[i] = perf.get('total', 0)
+                    self._ind_profit[i] = perf.get('total_profit', 0.0)
+                    self._ind_accuracy[i] = perf.get('accuracy', 0.5)
                 
                 # Load precision metrics with backward compatibility
+                # (older state files carry the ring metrics as JSON lists)
                 loaded_metrics = data.get('precision_metrics', {})
+                if os.path.exists(self.LEARNING_METRICS_FILE):
+                    with np.load(self.LEARNING_METRICS_FILE) as arrays:
+                        loaded_metrics.update({key: arrays[key] for key in arrays.files})
                 for key in self.precision_metrics:
                     if key in loaded_metrics:
-                        self.precision_metrics[key] = loaded_metrics[key]
+                        if isinstance(self.precision_metrics[key], _MetricRing):
+                            self.precision_metrics[key].extend(loaded_metrics[key])
+                        else:
+                            self.precision_metrics[key] = loaded_metrics[key]
                 
                 # Load strategy adjustments with backward compatibility
                 loaded_adjustments = data.get('strategy_adjustments', {})
@@ -124,20 +545,133 @@ class CryptoMarketAnalyzer:
     def _save_learning_state(self):
         """Save learning state to file to persist across script runs"""
         try:
+            # Float windows go to the binary sidecar; JSON keeps the scalar settings
+            rings = {key: value for key, value in self.precision_metrics.items()
+                     if isinstance(value, _MetricRing)}
+            self._save_metrics_bin(rings)
+            
             data = {
-                'performance_history': self.performance_history,
+                'performance_history': list(self.performance_history),
                 'indicator_performance': self.indicator_performance,
-                'precision_metrics': self.precision_metrics,
+                'precision_metrics': {
+                    key: value for key, value in self.precision_metrics.items()
+                    if key not in rings
+                },
                 'strategy_adjustments': self.strategy_adjustments,
                 'last_optimization': self.last_optimization.isoformat(),
                 'saved_at': datetime.now().isoformat()
             }
             
-            with open(self.LEARNING_DATA_FILE, 'w') as f:
-                json.dump(data, f, indent=2)
+            if ORJSON_AVAILABLE:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                                       | orjson.OPT_NON_STR_KEYS)
+            else:
+                payload = json.dumps(data, indent=2).encode('utf-8')
+            
+            # Single write to a temp file, then atomic rename (no torn state file on crash)
+            tmp_file = self.LEARNING_DATA_FILE + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_file, self.LEARNING_DATA_FILE)
+            self._dirty = False
+            self._last_save = time.monotonic()
         except Exception as e:
             print(f"⚠️  Could not save learning state: {e}")
     
+    def _save_metrics_bin(self, rings: Dict[str, '_MetricRing']):
+        """Write the metric rings as raw float64 arrays (no per-float text formatting)"""
+        tmp_file = self.LEARNING_METRICS_FILE + '.tmp'
+        with open(tmp_file, 'wb') as f:
+            np.savez(f, **{key: ring.tail(len(ring)) for key, ring in rings.items()})
+        os.replace(tmp_file, self.LEARNING_METRICS_FILE)
+    
+    def _flush_learning_state(self):
+        """Save learning state only if there are unsaved changes"""
+        if self._dirty:
+            self._save_learning_state()
+    
+    def _get_adaptive_log(self):
+        """Cached append handle for the adaptive-changes log (line-buffered)"""
+        if self._adaptive_log_fh is None:
+            os.makedirs(os.path.dirname(_ADAPTIVE_LOG_PATH), exist_ok=True)
+            self._adaptive_log_fh = open(_ADAPTIVE_LOG_PATH, 'a', encoding='utf-8', buffering=1)
+        return self._adaptive_log_fh
+    
+    def _close_adaptive_log(self):
+        """Close the cached log handle; the next write reopens the file"""
+        if self._adaptive_log_fh is not None:
+            self._adaptive_log_fh.close()
+            self._adaptive_log_fh = None
+    
+    def _record_history(self, timestamp: str, profit: float):
+        """Write one trade into the ring buffer (O(1), no allocation)"""
+        ts = int(datetime.fromisoformat(timestamp).timestamp() * 1e9)
+        profit = float(profit or 0.0)
+        
+        # Evict the trade leaving each window, then add the new one
+        if self._hist_n >= self.STRATEGY_WINDOW:
+            old = float(self._hist['profit'][(self._hist_i - self.STRATEGY_WINDOW) % self.HISTORY_SIZE])
+            self._win_sum -= old
+            self._win_sum_sq -= old * old
+            self._win_wins -= old > 0
+        self._win_sum += profit
+        self._win_sum_sq += profit * profit
+        self._win_wins += profit > 0
+        
+        if self._hist_n >= self.DYNAMIC_WINDOW:
+            old = float(self._hist['profit'][(self._hist_i - self.DYNAMIC_WINDOW) % self.HISTORY_SIZE])
+            self._dyn_sum -= old
+            self._dyn_wins -= old > 0
+        self._dyn_sum += profit
+        self._dyn_wins += profit > 0
+        
+        self._hist[self._hist_i] = (ts, profit)
+        self._hist_i = (self._hist_i + 1) % self.HISTORY_SIZE
+        self._hist_n = min(self._hist_n + 1, self.HISTORY_SIZE)
+    
+    def _recent_profits(self, n: int) -> np.ndarray:
+        """Profits of the last n trades in chronological order"""
+        n = min(n, self._hist_n)
+        idx = (self._hist_i - n + np.arange(n)) % self.HISTORY_SIZE
+        return self._hist['profit'][idx]
+    
+    def _indicator_slot(self, indicator: str) -> int:
+        """Row of an indicator in the table, allocating (and growing) on first sight"""
+        i = self._ind_index.get(indicator)
+        if i is None:
+            i = self._ind_index[indicator] = len(self._ind_index)
+            if i >= len(self._ind_total):
+                grow = len(self._ind_total)
+                self._ind_correct = np.concatenate((self._ind_correct, np.zeros(grow, dtype=np.int64)))
+                self._ind_total = np.concatenate((self._ind_total, np.zeros(grow, dtype=np.int64)))
+                self._ind_profit = np.concatenate((self._ind_profit, np.zeros(grow)))
+                self._ind_accuracy = np.concatenate((self._ind_accuracy, np.full(grow, 0.5)))
+        return i
+    
+    @property
+    def indicator_performance(self) -> Dict[str, Dict[str, Any]]:
+        """Per-indicator stats as a dict of dicts (the persisted schema)"""
+        return {
+            indicator: {
+                'correct': int(self._ind_correct[i]),
+                'wrong': int(self._ind_total[i] - self._ind_correct[i]),
+                'total': int(self._ind_total[i]),
+                'total_profit': float(self._ind_profit[i]),
+                'accuracy': float(self._ind_accuracy[i]),
+            }
+            for indicator, i in self._ind_index.items()
+        }
+    
+    def should_consult_llm(self, technical_score: float, sentiment_score: float) -> bool:
+        """
+        False when the LLM would rarely change the outcome: technicals and sentiment
+        strongly agree, or both are flat. Saves a full API round trip per symbol.
+        """
+        if ((technical_score > LLM_SKIP_AGREEMENT and sentiment_score > LLM_SKIP_AGREEMENT)
+                or (technical_score < -LLM_SKIP_AGREEMENT and sentiment_score < -LLM_SKIP_AGREEMENT)):
+            return False
+        return not (abs(technical_score) < LLM_SKIP_FLAT and abs(sentiment_score) < LLM_SKIP_FLAT)
+    
     def analyze_with_llm(self, symbol: str, market_data: Dict, sentiment_data: Dict, 
                         news_articles: List[Dict]) -> Dict[str, Any]:
         """
@@ -150,67 +684,73 @@ class CryptoMarketAnalyzer:
         # Prepare comprehensive market summary for LLM
         indicators = market_data['indicators']
         
-        # Extract key signals
-        strong_signals = []
-        weak_signals = []
-        
-        for ind_name, ind_data in indicators.items():
-            if isinstance(ind_data, dict) and 'signal' in ind_data:
-                signal = ind_data['signal']
-                if abs(signal) == 1:
-                    direction = "BULLISH" if signal > 0 else "BEARISH"
-                    strong_signals.append(f"{ind_name.upper()}: {direction}")
-                elif signal == 0:
-                    weak_signals.append(ind_name.upper())
-        
-        # Build comprehensive prompt
-        prompt = f"""You are an expert cryptocurrency trader analyzing {symbol}.
-
-CURRENT MARKET DATA:
-Price: ${market_data['price']:.2f}
-Volatility: {market_data['volatility']*100:.2f}% (annualized)
-ATR: {market_data['atr_pct']*100:.2f}%
-
-CANDLESTICK PATTERN ANALYSIS:
-Signal: {', '.join(strong_signals) if strong_signals else 'None'}
-Patterns Detected: {indicators.get('candlestick', {}).get('patterns', [])}
-Confidence: {indicators.get('candlestick', {}).get('confidence', 0)*100:.1f}%
-Description: {indicators.get('candlestick', {}).get('description', 'No significant patterns')}
-
-SENTIMENT ANALYSIS:
-Score: {sentiment_data.get('score', 0):.2f} (-1 to +1 scale)
-News Count: {len(news_articles)} articles
-Recent Headlines: {', '.join([a.get('title', '')[:60] for a in news_articles[:3]])}
-
-TASK:
-Analyze this data and provide:
-1. Trading Direction (LONG/SHORT/NEUTRAL)
-2. Confidence Level (0-100%)
-3. Key Reasoning (2-3 sentences)
-4. Risk Assessment (LOW/MEDIUM/HIGH)
-5. Recommended holding period (HOURS/DAYS/WEEK)
-
-Format your response as:
-DIRECTION: [LONG/SHORT/NEUTRAL]
-CONFIDENCE: [0-100]
-REASONING: [Your analysis]
-RISK: [LOW/MEDIUM/HIGH]
-TIMEFRAME: [HOURS/DAYS/WEEK]"""
+        # Strong signals are precomputed by get_market_data; derive them only for raw dicts
+        strong_signals = market_data.get('strong_signals')
+        if strong_signals is None:
+            _, strong_signals = summarize_indicator_signals(indicators)
+        
+        # Only the count and first 3 headlines go into the prompt - never walk the full feed
+        n_news = len(news_articles)
+        head_titles = [a.get('title', '')[:60] for a in islice(news_articles, 3)]
+        
+        candlestick = indicators.get('candlestick', {})
+        
+        # Fill the module-level template (skeleton is built once at import time)
+        prompt = _ANALYSIS_PROMPT_TEMPLATE.format_map({
+            'symbol': symbol,
+            'price': _fmt_price(market_data['price']),
+            'volatility_pct': _FMT0(market_data['volatility'] * 100),
+            'atr_pct': _FMT1(market_data['atr_pct'] * 100),
+            'signals': ', '.join(strong_signals) if strong_signals else 'None',
+            'patterns': candlestick.get('patterns', []),
+            'pattern_confidence_pct': _FMT0(candlestick.get('confidence', 0) * 100),
+            'description': candlestick.get('description', 'No significant patterns'),
+            'sentiment': _FMT2(sentiment_data.get('score', 0)),
+            'n_news': n_news,
+            'headlines': ', '.join(head_titles),
+        })
 
+        # Provider's configured model by default; only ambiguous cases justify the 70B model
+        model = self.model
+        if self.high_reasoning and abs(sentiment_data.get('score', 0)) < LLM_AMBIGUOUS_SENTIMENT:
+            model = LLM_HIGH_REASONING_MODEL
+        
+        # Same prompt within the TTL (e.g. re-analysis inside one bar) - reuse the answer
+        cache_key = blake2b(f"{model}\0{prompt}".encode('utf-8'), digest_size=16).digest()
+        now = time.monotonic()
+        with self._llm_cache_lock:
+            cached = self._llm_cache.get(cache_key)
+            if cached is not None:
+                if now - cached[0] < self.LLM_CACHE_TTL_SECONDS:
+                    self._llm_cache.move_to_end(cache_key)
+                    return cached[1].copy()  # Flat dict of immutable values
+                del self._llm_cache[cache_key]
+        
         try:
             # Use multi-provider LLM - automatically handles failover
             response = self.llm_client.chat(
-                prompt=prompt,
+                messages=[_SYSTEM_MSG, {"role": "user", "content": prompt}],
                 temperature=0.1,  # Low temperature for consistent analysis
-                max_tokens=300,  # Reduced for faster response
-                timeout=8  # Shorter timeout for faster 3B model
+                max_tokens=self.max_tokens,  # ~5 short lines of output
+                timeout=8,  # Shorter timeout for faster small model
+                model=model,
+                tools=[_TRADE_DECISION_TOOL],
+                tool_choice=_TRADE_DECISION_CHOICE
             )
             
             # Parse LLM response
             analysis = self._parse_llm_response(response)
+            if analysis.get('parse_error'):
+                # Never trade on defaults filled in for an unparseable reply
+                print(f"LLM analysis parse error for {symbol}: {response[:100]!r}")
+                return analysis
             analysis['raw_response'] = response
             analysis['llm_available'] = True
             
+            with self._llm_cache_lock:
+                self._llm_cache[cache_key] = (now, analysis.copy())
+                if len(self._llm_cache) > self.LLM_CACHE_SIZE:
+                    self._llm_cache.popitem(last=False)
             return analysis
             
         except Exception as e:
@@ -218,43 +758,44 @@ TIMEFRAME: [HOURS/DAYS/WEEK]"""
             return {'llm_available': False, 'error': str(e)}
     
     def _parse_llm_response(self, response: str) -> Dict[str, Any]:
-        """Parse structured LLM response"""
-        import re
-        
-        parsed = {
-            'direction': 'NEUTRAL',
-            'confidence': 50,
-            'reasoning': '',
-            'risk': 'MEDIUM',
-            'timeframe': 'HOURS'
-        }
-        
-        # Extract direction
-        direction_match = re.search(r'DIRECTION:\s*(LONG|SHORT|NEUTRAL)', response, re.I)
-        if direction_match:
-            parsed['direction'] = direction_match.group(1).upper()
-        
-        # Extract confidence
-        confidence_match = re.search(r'CONFIDENCE:\s*(\d+)', response)
-        if confidence_match:
-            parsed['confidence'] = int(confidence_match.group(1))
-        
-        # Extract reasoning
-        reasoning_match = re.search(r'REASONING:\s*(.+?)(?=RISK:|$)', response, re.S)
-        if reasoning_match:
-            parsed['reasoning'] = reasoning_match.group(1).strip()[:300]
-        
-        # Extract risk
-        risk_match = re.search(r'RISK:\s*(LOW|MEDIUM|HIGH)', response, re.I)
-        if risk_match:
-            parsed['risk'] = risk_match.group(1).upper()
-        
-        # Extract timeframe
-        timeframe_match = re.search(r'TIMEFRAME:\s*(HOURS|DAYS|WEEK)', response, re.I)
-        if timeframe_match:
-            parsed['timeframe'] = timeframe_match.group(1).upper()
-        
-        return parsed
+        """Parse structured LLM response (tool-call JSON, or the text format as fallback).
+        Returns {'llm_available': False, 'parse_error': True} when neither yields a valid
+        decision, so combine_analyses takes the no-LLM branch.
+        """
+        # Tool-call arguments arrive as JSON - no regex needed
+        if response.lstrip().startswith('{'):
+            try:
+                args = json.loads(response)
+            except ValueError:
+                args = None
+            if isinstance(args, dict):
+                decision = _validate_trade_decision(args)
+                if decision:
+                    return decision
+        
+        # Text format: one pass over the lines, no regex
+        fields = _split_text_fields(response)
+        
+        parsed = _DEFAULT_PARSED.copy()
+        if 'REASONING' in fields:
+            parsed['reasoning'] = fields['REASONING'].strip()[:300]
+        risk = _first_word(fields.get('RISK', ''))
+        if risk in _VALID_RISKS:
+            parsed['risk'] = risk
+        timeframe = _first_word(fields.get('TIMEFRAME', ''))
+        if timeframe in _VALID_TIMEFRAMES:
+            parsed['timeframe'] = timeframe
+        if 'DIRECTION' in fields:
+            parsed['direction'] = _first_word(fields['DIRECTION'])
+        confidence = _leading_int(fields.get('CONFIDENCE', ''))
+        if confidence is not None:
+            parsed['confidence'] = confidence
+        
+        # Direction and confidence are required - no silent NEUTRAL/50 defaults
+        decision = _validate_trade_decision(parsed)
+        if decision is None:
+            return {'llm_available': False, 'parse_error': True}
+        return decision
     
     def combine_analyses(self, technical_score: float, sentiment_score: float, 
                         llm_analysis: Optional[Dict]) -> Dict[str, Any]:
@@ -271,6 +812,12 @@ TIMEFRAME: [HOURS/DAYS/WEEK]"""
         This is a NEWS TRADING SYSTEM - technicals only validate/filter signals and provide execution levels
         """
         
+        # Flat market: every branch below ends NEUTRAL, so skip the arithmetic
+        if abs(sentiment_score) < _FLAT_MARKET_EPS and abs(technical_score) < _FLAT_MARKET_EPS:
+            if (not llm_analysis or not llm_analysis.get('llm_available')
+                    or llm_analysis.get('direction') == 'NEUTRAL'):
+                return dict(_NEUTRAL_RESULT)
+        
         # News/sentiment is the PRIMARY signal source
         news_sentiment_score = sentiment_score
         news_confidence = abs(sentiment_score)
@@ -376,13 +923,16 @@ TIMEFRAME: [HOURS/DAYS/WEEK]"""
         - TP too far (direction correct but target unreachable)
         - Wrong direction (prediction error)
         """
+        pm = self.precision_metrics
+        timestamp = datetime.now().isoformat()
         self.performance_history.append({
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp,
             'result': trade_result
         })
+        self._record_history(timestamp, trade_result.get('profit', 0))
         
         # Track total trades
-        self.precision_metrics['total_trades'] += 1
+        pm['total_trades'] += 1
         
         # NEW: Track failure reasons to learn different adjustment strategies
         failure_reason = trade_result.get('failure_reason')
@@ -390,17 +940,17 @@ TIMEFRAME: [HOURS/DAYS/WEEK]"""
         
         if not entry_reached:
             # Entry price was never reached (track for statistics)
-            self.precision_metrics['entry_not_reached_count'] += 1
+            pm['entry_not_reached_count'] += 1
         
         if failure_reason == 'sl_hit':
             # Stop loss hit before trend could work
-            self.precision_metrics['sl_hit_early_count'] += 1
+            pm['sl_hit_early_count'] += 1
         elif failure_reason == 'tp_not_reached':
             # Direction correct but TP too far
-            self.precision_metrics['tp_too_far_count'] += 1
+            pm['tp_too_far_count'] += 1
         elif failure_reason == 'wrong_direction':
             # Direction prediction was wrong
-            self.precision_metrics['wrong_direction_count'] += 1
+            pm['wrong_direction_count'] += 1
         
         # Track precision metrics (separate direction from TP precision)
         if 'profit' in trade_result:
@@ -410,7 +960,7 @@ TIMEFRAME: [HOURS/DAYS/WEEK]"""
             # Track direction accuracy (only if entry was reached)
             if entry_reached:
                 direction_correct = profit > 0
-                self.precision_metrics['direction_accuracy'].append(1 if direction_correct else 0)
+                pm['direction_accuracy'].append(1 if direction_correct else 0)
             
             # Track TP precision: did we reach TP or fall short?
             # Use max_favorable_move to see how close we got
@@ -426,26 +976,19 @@ TIMEFRAME: [HOURS/DAYS/WEEK]"""
                 # Calculate TP precision (1.0 = perfect, <1.0 = TP too far, >1.0 = TP too conservative)
                 if tp_distance > 0:
                     tp_precision = best_movement / tp_distance
-                    self.precision_metrics['tp_precision'].append(tp_precision)
+                    pm['tp_precision'].append(tp_precision)
                     
                     # Track overshoot (how much TP is typically too ambitious)
                     if tp_precision < 1.0:
-                        overshoot = 1.0 - tp_precision
-                        if self.precision_metrics['avg_tp_overshoot'] == 0:
-                            self.precision_metrics['avg_tp_overshoot'] = overshoot
-                        else:
-                            # Exponential moving average
-                            self.precision_metrics['avg_tp_overshoot'] = (
-                                0.7 * self.precision_metrics['avg_tp_overshoot'] + 0.3 * overshoot
-                            )
+                        # Exponential moving average of overshoot
+                        pm['avg_tp_overshoot'] = _update_ema(
+                            float(pm['avg_tp_overshoot']), 1.0 - tp_precision, 0.3
+                        )
                 
                 # Track actual average price movement for this timeframe
-                if self.precision_metrics['avg_price_movement'] == 0:
-                    self.precision_metrics['avg_price_movement'] = best_movement
-                else:
-                    self.precision_metrics['avg_price_movement'] = (
-                        0.8 * self.precision_metrics['avg_price_movement'] + 0.2 * best_movement
-                    )
+                pm['avg_price_movement'] = _update_ema(
+                    float(pm['avg_price_movement']), float(best_movement), 0.2
+                )
         
         # Track indicator performance if available
         if 'indicators' in trade_result and 'profit' in trade_result:
@@ -453,14 +996,7 @@ TIMEFRAME: [HOURS/DAYS/WEEK]"""
             is_win = profit > 0
             
             for indicator, signal in trade_result.get('indicators', {}).items():
-                if indicator not in self.indicator_performance:
-                    self.indicator_performance[indicator] = {
-                        'correct': 0,
-                        'wrong': 0,
-                        'total': 0,
-                        'total_profit': 0.0,
-                        'accuracy': 0.5  # Start neutral
-                    }
+                i = self._indicator_slot(indicator)  # New rows start at 0.5 accuracy (neutral)
                 
                 # Check if indicator was correct
                 direction_match = (
@@ -470,21 +1006,12 @@ TIMEFRAME: [HOURS/DAYS/WEEK]"""
                 )
                 
                 if direction_match:
-                    self.indicator_performance[indicator]['correct'] += 1
-                else:
-                    self.indicator_performance[indicator]['wrong'] += 1
-                
-                self.indicator_performance[indicator]['total'] += 1
-                self.indicator_performance[indicator]['total_profit'] += profit
+                    self._ind_correct[i] += 1
+                self._ind_total[i] += 1
+                self._ind_profit[i] += profit
                 
                 # Update accuracy
-                total = self.indicator_performance[indicator]['total']
-                correct = self.indicator_performance[indicator]['correct']
-                self.indicator_performance[indicator]['accuracy'] = correct / total if total > 0 else 0.5
-        
-        # Keep last 50 trades
-        if len(self.performance_history) > 50:
-            self.performance_history = self.performance_history[-50:]
+                self._ind_accuracy[i] = self._ind_correct[i] / self._ind_total[i]
         
         # Analyze performance and adjust strategy
         if len(self.performance_history) >= 10:
@@ -499,107 +1026,96 @@ TIMEFRAME: [HOURS/DAYS/WEEK]"""
         # Adaptive dynamic parameter tuning
         self._adjust_dynamic_parameters()
 
-        # Save learning state after each trade (persists across script runs)
-        self._save_learning_state()
+        # Save learning state (throttled; pending changes are flushed at exit)
+        self._dirty = True
+        if time.monotonic() - self._last_save >= self.SAVE_INTERVAL_SECONDS:
+            self._save_learning_state()
     
     def _adjust_strategy(self):
         """Adjust strategy based on recent performance - DYNAMIC OPTIMIZATION"""
-        recent_trades = self.performance_history[-20:]
+        pm = self.precision_metrics
+        sa = self.strategy_adjustments
         
-        if not recent_trades:
+        # Window stats from the running sums - no rescan of recent trades
+        n = min(self._hist_n, self.STRATEGY_WINDOW)
+        if not n:
             return
         
-        # Calculate win rate
-        wins = sum(1 for t in recent_trades if t['result'].get('profit', 0) > 0)
-        win_rate = wins / len(recent_trades)
-        
-        # Calculate average profit/loss
-        profits = [t['result'].get('profit', 0) for t in recent_trades]
-        avg_profit = sum(profits) / len(profits) if profits else 0
+        win_rate = self._win_wins / n
+        avg_profit = self._win_sum / n
+        last_profit = self._hist['profit'][(self._hist_i - 1) % self.HISTORY_SIZE]
         
         # Update streaks
-        if profits and profits[-1] > 0:
-            self.precision_metrics['current_win_streak'] += 1
-            self.precision_metrics['current_loss_streak'] = 0
-            self.precision_metrics['max_win_streak'] = max(
-                self.precision_metrics['max_win_streak'],
-                self.precision_metrics['current_win_streak']
+        if last_profit > 0:
+            pm['current_win_streak'] += 1
+            pm['current_loss_streak'] = 0
+            pm['max_win_streak'] = max(
+                pm['max_win_streak'],
+                pm['current_win_streak']
             )
-        elif profits and profits[-1] < 0:
-            self.precision_metrics['current_loss_streak'] += 1
-            self.precision_metrics['current_win_streak'] = 0
-            self.precision_metrics['max_loss_streak'] = max(
-                self.precision_metrics['max_loss_streak'],
-                self.precision_metrics['current_loss_streak']
+        elif last_profit < 0:
+            pm['current_loss_streak'] += 1
+            pm['current_win_streak'] = 0
+            pm['max_loss_streak'] = max(
+                pm['max_loss_streak'],
+                pm['current_loss_streak']
             )
         
         # More aggressive threshold adjustment on loss streaks
-        loss_streak = self.precision_metrics['current_loss_streak']
+        loss_streak = pm['current_loss_streak']
         if loss_streak >= 3:
             # On bad streak - be VERY selective
-            self.strategy_adjustments['confidence_threshold'] = min(0.65,
-                self.strategy_adjustments['confidence_threshold'] + 0.10)
+            sa['confidence_threshold'] = min(0.65,
+                sa['confidence_threshold'] + 0.10)
         elif win_rate < 0.35:
             # Losing too much - be MUCH more selective
-            self.strategy_adjustments['confidence_threshold'] = min(0.6, 
-                self.strategy_adjustments['confidence_threshold'] + 0.08)
+            sa['confidence_threshold'] = min(0.6, 
+                sa['confidence_threshold'] + 0.08)
         elif win_rate < 0.45:
             # Losing - be more selective
-            self.strategy_adjustments['confidence_threshold'] = min(0.5, 
-                self.strategy_adjustments['confidence_threshold'] + 0.05)
+            sa['confidence_threshold'] = min(0.5, 
+                sa['confidence_threshold'] + 0.05)
         elif win_rate > 0.65:
             # Winning a lot - can be more aggressive
-            self.strategy_adjustments['confidence_threshold'] = max(0.2,
-                self.strategy_adjustments['confidence_threshold'] - 0.03)
+            sa['confidence_threshold'] = max(0.2,
+                sa['confidence_threshold'] - 0.03)
         elif win_rate > 0.55:
             # Winning - slightly more aggressive
-            self.strategy_adjustments['confidence_threshold'] = max(0.25,
-                self.strategy_adjustments['confidence_threshold'] - 0.02)
+            sa['confidence_threshold'] = max(0.25,
+                sa['confidence_threshold'] - 0.02)
         
         # Adjust risk based on volatility of returns
-        if profits and len(profits) > 1:
-            import statistics
-            volatility = statistics.stdev(profits)
+        if n > 1:
+            # Sample stdev from sum / sum of squares (clamped against rounding below zero)
+            variance = (self._win_sum_sq - n * avg_profit * avg_profit) / (n - 1)
+            volatility = math.sqrt(max(variance, 0.0))
             
             if volatility > 0.15:  # Very high volatility
-                self.strategy_adjustments['risk_multiplier'] = 0.7
+                sa['risk_multiplier'] = 0.7
             elif volatility > 0.10:  # High volatility
-                self.strategy_adjustments['risk_multiplier'] = 0.8
+                sa['risk_multiplier'] = 0.8
             elif volatility < 0.05 and avg_profit > 0:  # Low volatility, profitable
-                self.strategy_adjustments['risk_multiplier'] = 1.1  # Can take more risk
+                sa['risk_multiplier'] = 1.1  # Can take more risk
             else:
-                self.strategy_adjustments['risk_multiplier'] = 1.0
+                sa['risk_multiplier'] = 1.0
         
         # NEW: Adjust TP based on precision metrics
-        if self.precision_metrics['tp_precision']:
+        if pm['tp_precision']:
             # Calculate average TP precision from recent trades
-            recent_tp_precision = self.precision_metrics['tp_precision'][-10:]
-            avg_tp_precision = sum(recent_tp_precision) / len(recent_tp_precision)
+            avg_tp_precision = pm['tp_precision'].tail_mean(10)
             
-            # If TP is consistently too far (avg < 0.7), reduce it
-            if avg_tp_precision < 0.7:
-                # TPs are too ambitious - reduce by the overshoot amount
-                overshoot = self.precision_metrics['avg_tp_overshoot']
-                self.strategy_adjustments['tp_adjustment_factor'] = max(0.6, 1.0 - overshoot * 0.8)
-                tp_reason = "TPs too ambitious, reducing"
-            elif avg_tp_precision < 0.85:
-                # TPs slightly too far - minor reduction
-                self.strategy_adjustments['tp_adjustment_factor'] = max(0.75, 
-                    self.strategy_adjustments['tp_adjustment_factor'] - 0.05)
-                tp_reason = "TPs slightly high, adjusting"
-            elif avg_tp_precision > 1.2:
-                # TPs too conservative - we're hitting them too easily
-                self.strategy_adjustments['tp_adjustment_factor'] = min(1.2,
-                    self.strategy_adjustments['tp_adjustment_factor'] + 0.05)
-                tp_reason = "TPs too conservative, increasing"
-            else:
-                # TPs are well-calibrated
-                tp_reason = "TP precision good"
+            # If TP is consistently too far (avg < 0.7), reduce it; too close, raise it
+            tp_factor, reason_idx = _tp_factor_step(
+                avg_tp_precision,
+                float(pm['avg_tp_overshoot']),
+                float(sa['tp_adjustment_factor'])
+            )
+            sa['tp_adjustment_factor'] = tp_factor
+            tp_reason = _TP_REASONS[reason_idx]
             
             # Calculate direction accuracy separately
-            if self.precision_metrics['direction_accuracy']:
-                recent_direction = self.precision_metrics['direction_accuracy'][-20:]
-                direction_accuracy = sum(recent_direction) / len(recent_direction)
+            if pm['direction_accuracy']:
+                direction_accuracy = pm['direction_accuracy'].tail_mean(20)
             else:
                 direction_accuracy = 0.5
         else:
@@ -607,28 +1123,28 @@ TIMEFRAME: [HOURS/DAYS/WEEK]"""
             direction_accuracy = 0.5
         
         # NEW: Adjust entry based on entry_not_reached failures
-        total = self.precision_metrics['total_trades']
+        total = pm['total_trades']
         if total >= 10:
-            entry_fail_rate = self.precision_metrics['entry_not_reached_count'] / total
+            entry_fail_rate = pm['entry_not_reached_count'] / total
             
             if entry_fail_rate > 0.3:
                 # Too many trades not opening - entry prices too far
                 # Gradual adjustment: reduce by 10% each time (not fixed to 0.5x)
-                current = self.strategy_adjustments['entry_adjustment_factor']
-                self.strategy_adjustments['entry_adjustment_factor'] = max(0.7, current - 0.1)
+                current = sa['entry_adjustment_factor']
+                sa['entry_adjustment_factor'] = max(0.7, current - 0.1)
                 entry_reason = f"Entry too far ({entry_fail_rate*100:.0f}%), reducing gradually"
             elif entry_fail_rate > 0.15:
                 # Moderate failures - small adjustment
-                current = self.strategy_adjustments['entry_adjustment_factor']
-                self.strategy_adjustments['entry_adjustment_factor'] = max(0.85, current - 0.05)
+                current = sa['entry_adjustment_factor']
+                sa['entry_adjustment_factor'] = max(0.85, current - 0.05)
                 entry_reason = f"Entry slightly far ({entry_fail_rate*100:.0f}%), minor adjustment"
             elif entry_fail_rate <= 0.05:
                 # Excellent rate - DON'T CHANGE IT! It's working well
                 # Only slowly recover toward 1.0 if we had reduced it before
-                current = self.strategy_adjustments['entry_adjustment_factor']
+                current = sa['entry_adjustment_factor']
                 if current < 1.0:
                     # Gradually return to baseline (1.0) if we're below it
-                    self.strategy_adjustments['entry_adjustment_factor'] = min(1.0, current + 0.02)
+                    sa['entry_adjustment_factor'] = min(1.0, current + 0.02)
                     entry_reason = f"Entry working well ({entry_fail_rate*100:.0f}%), slowly returning to baseline"
                 else:
                     # Already at baseline (1.0), don't touch it!
@@ -640,26 +1156,26 @@ TIMEFRAME: [HOURS/DAYS/WEEK]"""
         
         # NEW: Adjust SL based on sl_hit_early failures
         if total >= 10:
-            sl_early_rate = self.precision_metrics['sl_hit_early_count'] / total
+            sl_early_rate = pm['sl_hit_early_count'] / total
             
             if sl_early_rate > 0.3:
                 # Too many SL hits - stops too tight
                 # Gradual widening: add 10% each time
-                current = self.strategy_adjustments['sl_adjustment_factor']
-                self.strategy_adjustments['sl_adjustment_factor'] = min(1.5, current + 0.1)
+                current = sa['sl_adjustment_factor']
+                sa['sl_adjustment_factor'] = min(1.5, current + 0.1)
                 sl_reason = f"SL hit often ({sl_early_rate*100:.0f}%), widening gradually"
             elif sl_early_rate > 0.15:
                 # Moderate SL hits - small adjustment
-                current = self.strategy_adjustments['sl_adjustment_factor']
-                self.strategy_adjustments['sl_adjustment_factor'] = min(1.3, current + 0.05)
+                current = sa['sl_adjustment_factor']
+                sa['sl_adjustment_factor'] = min(1.3, current + 0.05)
                 sl_reason = f"SL hit moderately ({sl_early_rate*100:.0f}%), minor widening"
             elif sl_early_rate < 0.08 and direction_accuracy > 0.65:
                 # Very few SL hits AND good direction - can CAUTIOUSLY tighten
                 # But only if we widened stops before (returning to baseline)
-                current = self.strategy_adjustments['sl_adjustment_factor']
+                current = sa['sl_adjustment_factor']
                 if current > 1.0:
                     # Gradually return to baseline if we had widened before
-                    self.strategy_adjustments['sl_adjustment_factor'] = max(1.0, current - 0.03)
+                    sa['sl_adjustment_factor'] = max(1.0, current - 0.03)
                     sl_reason = f"SL working well ({sl_early_rate*100:.0f}%), slowly returning to baseline"
                 else:
                     # Already at or below baseline - don't tighten further!
@@ -672,20 +1188,20 @@ TIMEFRAME: [HOURS/DAYS/WEEK]"""
         print(f"\n📊 Strategy Auto-Adjusted:")
         print(f"   Win Rate: {win_rate*100:.1f}% | Avg Profit: {avg_profit*100:.2f}%")
         print(f"   Direction Accuracy: {direction_accuracy*100:.1f}%")
-        if self.precision_metrics['tp_precision']:
+        if pm['tp_precision']:
             print(f"   TP Precision: {avg_tp_precision*100:.1f}% ({tp_reason})")
-            print(f"   Avg Price Movement: {self.precision_metrics['avg_price_movement']*100:.2f}%")
-        print(f"   Confidence Threshold: {self.strategy_adjustments['confidence_threshold']:.2f}")
-        print(f"   Risk Multiplier: {self.strategy_adjustments['risk_multiplier']:.2f}")
-        print(f"   TP Adjustment: {self.strategy_adjustments['tp_adjustment_factor']:.2f}x")
+            print(f"   Avg Price Movement: {pm['avg_price_movement']*100:.2f}%")
+        print(f"   Confidence Threshold: {sa['confidence_threshold']:.2f}")
+        print(f"   Risk Multiplier: {sa['risk_multiplier']:.2f}")
+        print(f"   TP Adjustment: {sa['tp_adjustment_factor']:.2f}x")
         if total >= 10:
-            print(f"   Entry Adjustment: {self.strategy_adjustments['entry_adjustment_factor']:.2f}x ({entry_reason})")
-            print(f"   SL Adjustment: {self.strategy_adjustments['sl_adjustment_factor']:.2f}x ({sl_reason})")
+            print(f"   Entry Adjustment: {sa['entry_adjustment_factor']:.2f}x ({entry_reason})")
+            print(f"   SL Adjustment: {sa['sl_adjustment_factor']:.2f}x ({sl_reason})")
             print(f"   Failure Breakdown:")
             print(f"     • Entry not reached: {entry_fail_rate*100:.1f}%")
             print(f"     • SL hit early: {sl_early_rate*100:.1f}%")
-            tp_fail_rate = self.precision_metrics['tp_too_far_count'] / total
-            wrong_dir_rate = self.precision_metrics['wrong_direction_count'] / total
+            tp_fail_rate = pm['tp_too_far_count'] / total
+            wrong_dir_rate = pm['wrong_direction_count'] / total
             print(f"     • TP too far: {tp_fail_rate*100:.1f}%")
             print(f"     • Wrong direction: {wrong_dir_rate*100:.1f}%")
         print()
@@ -797,7 +1313,7 @@ TIMEFRAME: [HOURS/DAYS/WEEK]"""
         
         print(f"\n⚠️  CONSECUTIVE NO SIGNALS DETECTED: {streak} runs with no trades available")
         print("🔧 LOOSENING ML BARRIERS AGGRESSIVELY...")
-        print("=" * 60)
+        print(_BAR60)
         
         # 1. Move entry much closer to current price (aggressive adjustment)
         current_entry = self.strategy_adjustments['entry_adjustment_factor']
@@ -831,7 +1347,7 @@ TIMEFRAME: [HOURS/DAYS/WEEK]"""
         print(f"   TP Adjustment: {current_tp:.2f}x → {new_tp:.2f}x ({self.AGGRESSIVE_TP_REDUCTION*100:.0f}% reduction)")
         self.strategy_adjustments['tp_adjustment_factor'] = new_tp
         
-        print("=" * 60)
+        print(_BAR60)
         print("✅ Parameters loosened to allow more trades through")
         print(f"💡 Strategy will automatically tighten again when signals start generating\n")
     
@@ -840,11 +1356,11 @@ TIMEFRAME: [HOURS/DAYS/WEEK]"""
         Dynamically optimize indicator weights based on performance
         Remove underperforming indicators, boost winning ones
         """
-        if not self.indicator_performance:
+        if not self._ind_index:
             return
         
-        print(f"\n🔧 OPTIMIZING INDICATOR WEIGHTS...")
-        print(f"{'='*60}")
+        # Report is collected and written with one print call
+        lines = ["\n🔧 OPTIMIZING INDICATOR WEIGHTS...", _BAR60]
         
         # Sort indicators by accuracy
         sorted_indicators = sorted(
@@ -861,37 +1377,19 @@ TIMEFRAME: [HOURS/DAYS/WEEK]"""
             avg_profit = perf['total_profit'] / total if total > 0 else 0
             
             # Calculate new weight based on performance
-            if accuracy >= 0.65 and avg_profit > 0:
-                # Excellent indicator - BOOST weight
-                weight_multiplier = 1.5
-                status = "⭐ BOOSTED"
-            elif accuracy >= 0.55 and avg_profit >= 0:
-                # Good indicator - slight boost
-                weight_multiplier = 1.2
-                status = "✅ GOOD"
-            elif accuracy >= 0.45:
-                # Neutral - keep base weight
-                weight_multiplier = 1.0
-                status = "➖ NEUTRAL"
-            elif accuracy >= 0.35:
-                # Underperforming - reduce weight
-                weight_multiplier = 0.7
-                status = "⚠️ WEAK"
-            else:
-                # Poor indicator - heavily reduce or remove
-                weight_multiplier = 0.3
-                status = "❌ POOR"
+            weight_multiplier, status = _weight_bucket(accuracy, avg_profit)
             
             new_weights[indicator] = weight_multiplier
             
-            print(f"   {indicator.upper():15} | Accuracy: {accuracy*100:5.1f}% | "
-                  f"Trades: {total:3} | Profit: {avg_profit*100:+6.2f}% | {status}")
+            lines.append(f"   {indicator.upper():15} | Accuracy: {accuracy*100:5.1f}% | "
+                         f"Trades: {total:3} | Profit: {avg_profit*100:+6.2f}% | {status}")
         
         # Store optimized weights
         self.strategy_adjustments['indicator_weights'] = new_weights
         
-        print(f"{'='*60}")
-        print(f"✅ Indicator weights optimized!\n")
+        lines.append(_BAR60)
+        lines.append("✅ Indicator weights optimized!\n")
+        print('\n'.join(lines))
     
     def get_adjusted_parameters(self) -> Dict[str, float]:
         """Get current adjusted parameters for trading"""
@@ -906,42 +1404,45 @@ TIMEFRAME: [HOURS/DAYS/WEEK]"""
         if not self.performance_history:
             return {'status': 'No trades yet'}
         
-        recent = self.performance_history[-20:]
-        profits = [t['result'].get('profit', 0) for t in recent]
-        wins = sum(1 for p in profits if p > 0)
+        pm = self.precision_metrics
+        sa = self.strategy_adjustments
+        sa_get = sa.get
+        
+        # One compiled pass over the profit ring buffer - no walk over trade dicts
+        profits = self._recent_profits(20)
+        n_recent = len(profits)
+        win_rate, avg_profit = _perf_reduce(profits)
+        accuracy = self._ind_accuracy
         
         # Calculate precision metrics
         precision_summary = {}
-        if self.precision_metrics['direction_accuracy']:
-            recent_dir = self.precision_metrics['direction_accuracy'][-20:]
-            precision_summary['direction_accuracy'] = sum(recent_dir) / len(recent_dir)
+        if pm['direction_accuracy']:
+            precision_summary['direction_accuracy'] = pm['direction_accuracy'].tail_mean(20)
         
-        if self.precision_metrics['tp_precision']:
-            recent_tp = self.precision_metrics['tp_precision'][-20:]
-            precision_summary['tp_precision'] = sum(recent_tp) / len(recent_tp)
-            precision_summary['avg_tp_overshoot'] = self.precision_metrics['avg_tp_overshoot']
-            precision_summary['avg_price_movement'] = self.precision_metrics['avg_price_movement']
+        if pm['tp_precision']:
+            precision_summary['tp_precision'] = pm['tp_precision'].tail_mean(20)
+            precision_summary['avg_tp_overshoot'] = pm['avg_tp_overshoot']
+            precision_summary['avg_price_movement'] = pm['avg_price_movement']
         
         return {
             'total_trades': len(self.performance_history),
-            'recent_trades': len(recent),
-            'win_rate': wins / len(recent) if recent else 0,
-            'avg_profit': sum(profits) / len(profits) if profits else 0,
-            'best_indicators': sorted(
-                [(k, v['accuracy']) for k, v in self.indicator_performance.items()],
-                key=lambda x: x[1],
-                reverse=True
-            )[:5],
-            'confidence_threshold': self.strategy_adjustments['confidence_threshold'],
-            'risk_multiplier': self.strategy_adjustments['risk_multiplier'],
-            'tp_adjustment_factor': self.strategy_adjustments.get('tp_adjustment_factor', 1.0),
+            'recent_trades': n_recent,
+            'win_rate': win_rate,
+            'avg_profit': avg_profit,
+            'best_indicators': [
+                (name, float(accuracy[i]))
+                for name, i in heapq.nlargest(5, self._ind_index.items(), key=lambda kv: accuracy[kv[1]])
+            ],
+            'confidence_threshold': sa['confidence_threshold'],
+            'risk_multiplier': sa['risk_multiplier'],
+            'tp_adjustment_factor': sa_get('tp_adjustment_factor', 1.0),
             'precision_metrics': precision_summary,
             # Dynamic adaptive parameters exposure
-            'expected_return_per_sentiment': self.strategy_adjustments.get('expected_return_per_sentiment'),
-            'news_impact_multiplier': self.strategy_adjustments.get('news_impact_multiplier'),
-            'max_news_bonus': self.strategy_adjustments.get('max_news_bonus'),
-            'dynamic_max_leverage': self.strategy_adjustments.get('dynamic_max_leverage'),
-            'daily_risk_limit': self.strategy_adjustments.get('daily_risk_limit'),
+            'expected_return_per_sentiment': sa_get('expected_return_per_sentiment'),
+            'news_impact_multiplier': sa_get('news_impact_multiplier'),
+            'max_news_bonus': sa_get('max_news_bonus'),
+            'dynamic_max_leverage': sa_get('dynamic_max_leverage'),
+            'daily_risk_limit': sa_get('daily_risk_limit'),
         }
 
     def _adjust_dynamic_parameters(self):
@@ -954,31 +1455,33 @@ TIMEFRAME: [HOURS/DAYS/WEEK]"""
         if total_trades_global < 15:
             return  # Not enough data yet for meaningful adaptation
 
-        total = max(1, self.precision_metrics['total_trades'])
-        enr = self.precision_metrics['entry_not_reached_count'] / total
-        slh = self.precision_metrics['sl_hit_early_count'] / total
-        tpf = self.precision_metrics['tp_too_far_count'] / total
-        wdg = self.precision_metrics['wrong_direction_count'] / total
-
-        # Recent performance slice
-        win_rate = 0.0
-        if self.performance_history:
-            recent = self.performance_history[-40:]
-            wins = sum(1 for t in recent if t['result'].get('profit', 0) > 0)
-            win_rate = wins / len(recent) if recent else 0
-
-        avg_profit = 0.0
-        if self.performance_history:
-            profits = [t['result'].get('profit', 0) for t in self.performance_history[-40:]]
-            avg_profit = sum(profits) / len(profits) if profits else 0.0
-
-        erps = self.strategy_adjustments['expected_return_per_sentiment']
-        nim = self.strategy_adjustments['news_impact_multiplier']
-        mnb = self.strategy_adjustments['max_news_bonus']
-        lev_cap = self.strategy_adjustments['dynamic_max_leverage']
-        risk_lim = self.strategy_adjustments['daily_risk_limit']
-        sl_adj = self.strategy_adjustments['sl_adjustment_factor']
-        tp_adj = self.strategy_adjustments['tp_adjustment_factor']
+        pm = self.precision_metrics
+        sa = self.strategy_adjustments
+
+        # No new trade since the last run - every input (and so the result) is unchanged
+        if pm['total_trades'] == self._last_adjust_total:
+            return
+        self._last_adjust_total = pm['total_trades']
+        
+        enr_c, slh_c, tpf_c, wdg_c, total = _PREC_KEYS(pm)
+        total = max(1, total)
+        enr = enr_c / total
+        slh = slh_c / total
+        tpf = tpf_c / total
+        wdg = wdg_c / total
+
+        # Recent performance from the running DYNAMIC_WINDOW sums (O(1), no slicing)
+        n = min(self._hist_n, self.DYNAMIC_WINDOW)
+        win_rate = self._dyn_wins / n if n else 0.0
+        avg_profit = self._dyn_sum / n if n else 0.0
+
+        erps = sa['expected_return_per_sentiment']
+        nim = sa['news_impact_multiplier']
+        mnb = sa['max_news_bonus']
+        lev_cap = sa['dynamic_max_leverage']
+        risk_lim = sa['daily_risk_limit']
+        sl_adj = sa['sl_adjustment_factor']
+        tp_adj = sa['tp_adjustment_factor']
 
         # Entry failures -> reduce expected return slightly (closer targets)
         if enr > 0.15:
@@ -1004,10 +1507,10 @@ TIMEFRAME: [HOURS/DAYS/WEEK]"""
 
         # Wrong direction -> raise confidence threshold & reduce leverage
         if wdg > 0.2:
-            self.strategy_adjustments['confidence_threshold'] = min(0.6, self.strategy_adjustments['confidence_threshold'] + 0.05)
+            sa['confidence_threshold'] = min(0.6, sa['confidence_threshold'] + 0.05)
             lev_cap = max(3, lev_cap - 2)
         elif wdg < 0.08 and win_rate > 0.55:
-            self.strategy_adjustments['confidence_threshold'] = max(0.25, self.strategy_adjustments['confidence_threshold'] - 0.02)
+            sa['confidence_threshold'] = max(0.25, sa['confidence_threshold'] - 0.02)
 
         # Sustained losses tighten daily risk limit; good performance allows mild expansion
         if win_rate < 0.35 and total >= 25:
@@ -1016,70 +1519,73 @@ TIMEFRAME: [HOURS/DAYS/WEEK]"""
             risk_lim = min(0.07, risk_lim * 1.02)
 
         # Bounds
-        erps = max(*ADAPTIVE_LIMITS['expected_return_per_sentiment']) if erps > ADAPTIVE_LIMITS['expected_return_per_sentiment'][1] else max(ADAPTIVE_LIMITS['expected_return_per_sentiment'][0], erps)
-        nim = max(*ADAPTIVE_LIMITS['news_impact_multiplier']) if nim > ADAPTIVE_LIMITS['news_impact_multiplier'][1] else max(ADAPTIVE_LIMITS['news_impact_multiplier'][0], nim)
-        mnb = max(*ADAPTIVE_LIMITS['max_news_bonus']) if mnb > ADAPTIVE_LIMITS['max_news_bonus'][1] else max(ADAPTIVE_LIMITS['max_news_bonus'][0], mnb)
-        lev_cap = max(ADAPTIVE_LIMITS['dynamic_max_leverage'][0], min(lev_cap, ADAPTIVE_LIMITS['dynamic_max_leverage'][1]))
-        sl_adj = max(ADAPTIVE_LIMITS['sl_adjustment_factor'][0], min(sl_adj, ADAPTIVE_LIMITS['sl_adjustment_factor'][1]))
-        tp_adj = max(ADAPTIVE_LIMITS['tp_adjustment_factor'][0], min(tp_adj, ADAPTIVE_LIMITS['tp_adjustment_factor'][1]))
-        risk_lim = max(ADAPTIVE_LIMITS['daily_risk_limit'][0], min(risk_lim, ADAPTIVE_LIMITS['daily_risk_limit'][1]))
-
-        # Persist (capture old/new for logging before assignment)
-        old_values = {
-            'expected_return_per_sentiment': self.strategy_adjustments['expected_return_per_sentiment'],
-            'news_impact_multiplier': self.strategy_adjustments['news_impact_multiplier'],
-            'max_news_bonus': self.strategy_adjustments['max_news_bonus'],
-            'dynamic_max_leverage': self.strategy_adjustments['dynamic_max_leverage'],
-            'daily_risk_limit': self.strategy_adjustments['daily_risk_limit'],
-            'sl_adjustment_factor': self.strategy_adjustments['sl_adjustment_factor'],
-            'tp_adjustment_factor': self.strategy_adjustments['tp_adjustment_factor']
-        }
-        self.strategy_adjustments['expected_return_per_sentiment'] = round(erps, 5)
-        self.strategy_adjustments['news_impact_multiplier'] = round(nim, 5)
-        self.strategy_adjustments['max_news_bonus'] = round(mnb, 5)
-        self.strategy_adjustments['dynamic_max_leverage'] = lev_cap
-        self.strategy_adjustments['daily_risk_limit'] = round(risk_lim, 5)
-        self.strategy_adjustments['sl_adjustment_factor'] = round(sl_adj, 5)
-        self.strategy_adjustments['tp_adjustment_factor'] = round(tp_adj, 5)
-
-        # Logging adaptive changes (only if any value changed)
-        new_values = {
-            'expected_return_per_sentiment': self.strategy_adjustments['expected_return_per_sentiment'],
-            'news_impact_multiplier': self.strategy_adjustments['news_impact_multiplier'],
-            'max_news_bonus': self.strategy_adjustments['max_news_bonus'],
-            'dynamic_max_leverage': self.strategy_adjustments['dynamic_max_leverage'],
-            'daily_risk_limit': self.strategy_adjustments['daily_risk_limit'],
-            'sl_adjustment_factor': self.strategy_adjustments['sl_adjustment_factor'],
-            'tp_adjustment_factor': self.strategy_adjustments['tp_adjustment_factor']
+        lo, hi = _LIM_ERPS
+        erps = _clip(erps, lo, hi)
+        lo, hi = _LIM_NIM
+        nim = _clip(nim, lo, hi)
+        lo, hi = _LIM_MNB
+        mnb = _clip(mnb, lo, hi)
+        lo, hi = _LIM_LEV
+        lev_cap = _clip(lev_cap, lo, hi)
+        lo, hi = _LIM_SL
+        sl_adj = _clip(sl_adj, lo, hi)
+        lo, hi = _LIM_TP
+        tp_adj = _clip(tp_adj, lo, hi)
+        lo, hi = _LIM_RISK
+        risk_lim = _clip(risk_lim, lo, hi)
+
+        # Persist, diffing inline: only parameters that actually moved are written and logged.
+        # Compared on final values, not per-branch flags: clamping/rounding can still
+        # change values set elsewhere (e.g. tp/sl factors from _adjust_strategy)
+        old_values = {}
+        new_values = {}
+        for key, value in zip(_DYNAMIC_KEY_NAMES, (round(erps, 5), round(nim, 5), round(mnb, 5), lev_cap,
+                                                   round(risk_lim, 5), round(sl_adj, 5), round(tp_adj, 5))):
+            prev = sa[key]
+            if prev != value:
+                old_values[key] = prev
+                new_values[key] = value
+                sa[key] = value
+        if not new_values:
+            return  # Nothing moved - no log write
+
+        # Rotate if file exceeds ~1MB (one stat call; a missing file has nothing to rotate)
+        try:
+            if os.stat(_ADAPTIVE_LOG_PATH).st_size > _ADAPTIVE_LOG_MAX_BYTES:
+                ts = time.strftime('%Y%m%d_%H%M%S', time.gmtime())
+                os.replace(_ADAPTIVE_LOG_PATH, f'logs/adaptive_changes_{ts}.jsonl')
+                self._close_adaptive_log()  # Handle still points at the rotated file
+        except OSError:
+            pass
+
+        # Logging adaptive changes (changed parameters only)
+        log_entry = {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+            'metrics': {
+                'enr': round(enr, 4),
+                'slh': round(slh, 4),
+                'tpf': round(tpf, 4),
+                'wdg': round(wdg, 4),
+                'win_rate': round(win_rate, 4),
+                'avg_profit': round(avg_profit, 5)
+            },
+            'old': old_values,
+            'new': new_values
         }
-        if old_values != new_values:
-            try:
-                os.makedirs('logs', exist_ok=True)
-                # Rotate if file exceeds ~1MB
-                log_path = 'logs/adaptive_changes.jsonl'
-                if os.path.exists(log_path) and os.path.getsize(log_path) > 1_000_000:
-                    import time as _t
-                    ts = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
-                    rotated = f'logs/adaptive_changes_{ts}.jsonl'
-                    try:
-                        os.replace(log_path, rotated)
-                    except Exception:
-                        pass
-                log_entry = {
-                    'timestamp': datetime.utcnow().isoformat()+ 'Z',
-                    'metrics': {
-                        'enr': round(enr, 4),
-                        'slh': round(slh, 4),
-                        'tpf': round(tpf, 4),
-                        'wdg': round(wdg, 4),
-                        'win_rate': round(win_rate, 4),
-                        'avg_profit': round(avg_profit, 5)
-                    },
-                    'old': old_values,
-                    'new': new_values
-                }
-                with open('logs/adaptive_changes.jsonl', 'a', encoding='utf-8') as f:
-                    f.write(json.dumps(log_entry) + '\n')
-            except Exception:
-                pass
+        try:
+            self._get_adaptive_log().write(json.dumps(log_entry) + '\n')
+        except OSError:
+            pass
+
+
+# Global analyzer instance - shared across symbols so learning state and
+# LLM request coalescing are not fragmented per coin
+_analyzer_instance: Optional[CryptoMarketAnalyzer] = None
+
 
+def get_analyzer(llm_client=None) -> CryptoMarketAnalyzer:
+    """Get the global market analyzer instance (created on first call)"""
+    global _analyzer_instance
+    if _analyzer_instance is None:
+        _analyzer_instance = CryptoMarketAnalyzer(llm_client)
+    return _analyzer_instance
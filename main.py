@@ -13,22 +13,30 @@ Simple Crypto Trader - NEWS-DRIVEN Cryptocurrency Trading Signal Generator
 Built for 24/7 crypto markets with SHORT-TERM trades (2 hours max duration)
 """
 
+import atexit
+import copy
+import importlib.util
+import io
 import json
 import logging
 import logging.handlers
 import math
 import os
+import queue
 import re
 import sys
+import threading
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from functools import lru_cache
 
 import numpy as np
 import pandas as pd
 import pytz
 import requests
-import yfinance as yf
-from newsapi import NewsApiClient
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 # Small sentinel class used as placeholder for optional modules for the static analyzer.
@@ -42,12 +50,8 @@ class _MissingOptional:
 
 # Force UTF-8 encoding for Windows console
 if sys.platform == "win32":
-    import codecs
-
-    if sys.stdout.encoding != "utf-8":
-        sys.stdout = codecs.getwriter("utf-8")(sys.stdout.buffer, "strict")
-    if sys.stderr.encoding != "utf-8":
-        sys.stderr = codecs.getwriter("utf-8")(sys.stderr.buffer, "strict")
+    sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+    sys.stderr.reconfigure(encoding="utf-8", errors="replace")
 
 
 # Setup comprehensive logging
@@ -123,6 +127,7 @@ from config import (
     EXPECTED_RETURN_PER_SENTIMENT,
     INDICATOR_WEIGHTS,
     LOW_MONEY_MODE,
+    MARKET_DATA_CACHE_FILE,
     MAX_LEVERAGE_CRYPTO,
     MAX_NEWS_BONUS,
     MAX_STOP_PCT,
@@ -142,8 +147,10 @@ from config import (
     TRADE_LOG_FILE,
     apply_trade_bounds,
 )
-from llm_analyzer import CryptoMarketAnalyzer
-from news_cache import get_news_cache, sort_articles_by_time
+from llm_analyzer import get_analyzer, summarize_indicator_signals
+from news_cache import dedupe_articles, get_news_cache, sort_articles_by_time
+from numba_compat import njit
+from trade_log import append_trade, load_trade_log, write_trade_log
 from social_monitor import SocialMediaMonitor, aggregate_social_sentiment
 
 # Predefine optional module-level symbols to avoid static analyzer "possibly unbound" errors
@@ -198,16 +205,9 @@ try:
 except ImportError:
     MONITOR_AVAILABLE = False
 
-try:
-    import joblib
-    import numpy as np
-    import pandas as pd
-    from sklearn.ensemble import RandomForestClassifier
-    from sklearn.preprocessing import StandardScaler
-
-    ML_AVAILABLE = True
-except ImportError:
-    ML_AVAILABLE = False
+# Probe for the ML stack without importing it (sklearn/joblib load in ml_module when used)
+ML_AVAILABLE = all(importlib.util.find_spec(name) for name in ("joblib", "sklearn"))
+if not ML_AVAILABLE:
     print(
         "Warning: ML libraries not available. Install scikit-learn, numpy, pandas, joblib"
     )
@@ -230,20 +230,20 @@ if not NEWS_API_KEY:
     NEWS_API_KEY = None  # Explicitly mark missing
     newsapi = None
 else:
+    from newsapi import NewsApiClient
+
     newsapi = NewsApiClient(api_key=NEWS_API_KEY)
 
 # Initialize multi-provider LLM client if available
 if LLM_AVAILABLE:
     try:
         llm_client = MultiProviderLLMClient()
-        market_analyzer = CryptoMarketAnalyzer(llm_client)
     except Exception as e:
         print(f"Warning: Could not initialize LLM client: {e}")
         llm_client = None
-        market_analyzer = CryptoMarketAnalyzer(None)
 else:
     llm_client = None
-    market_analyzer = CryptoMarketAnalyzer(None)
+market_analyzer = get_analyzer(llm_client)
 
 probability_predictor = (
     ProbabilityPredictor(llm_client=llm_client)
@@ -395,6 +395,11 @@ CRYPTO_NEWS_SOURCES = [
     ("CryptoNews", "https://cryptonews.com/news/feed/"),
 ]
 
+# Parallel RSS fetch workers (one per feed, I/O-bound)
+RSS_FETCH_WORKERS = 8
+# Items parsed per feed (feeds list newest first; parsing stops here)
+RSS_MAX_ITEMS = 50
+
 # ==================== ALL PARAMETERS NOW IN config.py ====================
 # Risk Management, News Parameters, ML Config, etc. are imported from config.py
 # This keeps the code clean and allows easy optimization
@@ -403,45 +408,160 @@ CRYPTO_NEWS_SOURCES = [
 if not ML_AVAILABLE:
     ML_ENABLED = False
 
+# Shared HTTP session: pooled keep-alive connections for Telegram, RSS and CoinGecko
+# (saves a TCP+TLS handshake per request after the first to each host)
+_HTTP = requests.Session()
+_HTTP.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.3),
+    ),
+)
+_HTTP.headers.update({"User-Agent": "CryptoTrader/1.0"})
+
+# Precompiled patterns for RSS parsing and LLM response parsing
+_ITEM_RE = re.compile(r"<item>(.*?)</item>", re.S | re.I)
+_TITLE_RE = re.compile(r"<title>(.*?)</title>", re.S | re.I)
+_DESC_RE = re.compile(r"<description>(.*?)</description>", re.S | re.I)
+_TAG_RE = re.compile(r"<[^>]+>")
+_SCORE_RE = re.compile(r"SCORE:\s*([-+]?[0-9]*\.?[0-9]+)")
+_REASON_RE = re.compile(r"REASON:\s*(.+)", re.S)
+
 # ==================== UTILITY FUNCTIONS ====================
 
 
+# Telegram messages are posted by one background worker so callers never block
+# on the network; the queue is drained at interpreter exit
+TELEGRAM_FLUSH_TIMEOUT = 15
+_telegram_queue = queue.Queue()
+_telegram_worker = None
+_telegram_worker_lock = threading.Lock()
+
+
+def _telegram_worker_loop():
+    url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
+    while True:
+        message = _telegram_queue.get()
+        if message is None:  # Shutdown sentinel from _flush_telegram_messages
+            return
+        try:
+            data = {"chat_id": TELEGRAM_CHAT_ID, "text": message, "parse_mode": "Markdown"}
+            _HTTP.post(url, data=data, timeout=10)
+        except Exception as e:
+            logger.error(f"Telegram notification failed: {e}")
+
+
+def _flush_telegram_messages():
+    """Deliver queued messages before exit (bounded by TELEGRAM_FLUSH_TIMEOUT)"""
+    if _telegram_worker is not None:
+        _telegram_queue.put(None)
+        _telegram_worker.join(TELEGRAM_FLUSH_TIMEOUT)
+
+
 def send_telegram_message(message):
-    """Send notification via Telegram"""
+    """Queue a Telegram notification (sent in the background, returns immediately)"""
+    global _telegram_worker
     if not TELEGRAM_BOT_TOKEN or not TELEGRAM_CHAT_ID:
         return
 
+    with _telegram_worker_lock:
+        if _telegram_worker is None:
+            _telegram_worker = threading.Thread(
+                target=_telegram_worker_loop, name="telegram-sender", daemon=True
+            )
+            _telegram_worker.start()
+            atexit.register(_flush_telegram_messages)
+    _telegram_queue.put(message)
+
+
+def _strip_tags(text):
+    """Drop HTML tags (most titles have none - skip the regex then)"""
+    return _TAG_RE.sub("", text) if "<" in text else text
+
+
+def _local_name(tag):
+    """Tag without its '{namespace}' prefix"""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _parse_rss_items(content, max_items=RSS_MAX_ITEMS):
+    """
+    Extract title/description pairs from RSS XML in one streaming pass with the
+    C-accelerated ElementTree parser (handles CDATA and entities). Each <item>
+    is cleared once read and parsing stops after max_items. Malformed feeds
+    fall back to the regex scan.
+    """
+    items = []
     try:
-        url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
-        data = {"chat_id": TELEGRAM_CHAT_ID, "text": message, "parse_mode": "Markdown"}
-        requests.post(url, data=data, timeout=10)
-    except Exception as e:
-        logger.error(f"Telegram notification failed: {e}")
+        for _, elem in ET.iterparse(io.BytesIO(content), events=("end",)):
+            # Match on the local name: RSS 1.0/RDF feeds put items in a namespace
+            if _local_name(elem.tag) != "item":
+                continue
+            fields = {}
+            for child in elem:
+                fields.setdefault(_local_name(child.tag), child.text or "")
+            # Descriptions often carry HTML markup inside CDATA - strip the tags
+            title = _strip_tags(fields.get("title", "")).strip()
+            desc = _strip_tags(fields.get("description", "")).strip()
+            elem.clear()  # Keep memory flat on large feeds
+            if title or desc:
+                items.append({"title": title, "description": desc})
+                if len(items) >= max_items:
+                    break
+    except ET.ParseError:
+        return _parse_rss_items_regex(content.decode("utf-8", "replace"))[:max_items]
+    return items
+
+
+def _parse_rss_items_regex(text):
+    """Regex fallback for feeds that are not well-formed XML"""
+    items = []
+    for block in _ITEM_RE.findall(text):
+        title_m = _TITLE_RE.search(block)
+        desc_m = _DESC_RE.search(block)
+        title = _strip_tags(title_m.group(1)).strip() if title_m else ""
+        desc = _strip_tags(desc_m.group(1)).strip() if desc_m else ""
+        if title or desc:
+            items.append({"title": title, "description": desc})
+    return items
 
 
 def fetch_rss_feed(url, timeout=10):
     """Fetch and parse RSS feed"""
     try:
-        resp = requests.get(
-            url, timeout=timeout, headers={"User-Agent": "CryptoTrader/1.0"}
-        )
-        items = []
-        for block in re.findall(r"<item>(.*?)</item>", resp.text, re.S | re.I):
-            title_m = re.search(r"<title>(.*?)</title>", block, re.S | re.I)
-            desc_m = re.search(r"<description>(.*?)</description>", block, re.S | re.I)
-            title = re.sub("<.*?>", "", title_m.group(1)).strip() if title_m else ""
-            desc = re.sub("<.*?>", "", desc_m.group(1)).strip() if desc_m else ""
-            if title or desc:
-                items.append({"title": title, "description": desc})
-        return items
+        resp = _HTTP.get(url, timeout=timeout)
+        return _parse_rss_items(resp.content)
     except Exception as e:
         logger.debug(f"RSS fetch error for {url}: {e}")
         return []
 
 
+def _published_before(pub_date, cutoff, cutoff_iso):
+    """
+    True if an ISO-8601 timestamp is older than cutoff. NewsAPI's usual
+    "2025-01-01T12:00:00Z" form sorts lexicographically and is compared as a
+    string; other forms (offsets, fractional seconds) are parsed.
+    Unparseable or missing timestamps are kept (False).
+    """
+    if not pub_date:
+        return False
+    if len(pub_date) == len(cutoff_iso) and pub_date.endswith("Z"):
+        return pub_date < cutoff_iso
+    try:
+        published = datetime.fromisoformat(pub_date.replace("Z", "+00:00"))
+    except ValueError:
+        return False
+    if published.tzinfo is None:
+        published = published.replace(tzinfo=pytz.UTC)
+    return published < cutoff
+
+
 def get_crypto_news():
     """Fetch cryptocurrency news or return demo placeholders if API key missing."""
-    cutoff = datetime.now() - timedelta(hours=24)
+    cutoff = datetime.now(pytz.UTC) - timedelta(hours=24)
+    cutoff_iso = cutoff.strftime("%Y-%m-%dT%H:%M:%SZ")
     articles = []
     if NEWS_API_KEY and newsapi:
         try:
@@ -450,14 +570,8 @@ def get_crypto_news():
                 q=query, language="en", sort_by="publishedAt", page_size=100
             )
             for article in resp.get("articles", []):
-                pub_date = article.get("publishedAt")
-                if pub_date:
-                    try:
-                        pub_dt = datetime.fromisoformat(pub_date.replace("Z", "+00:00"))
-                        if pub_dt.replace(tzinfo=None) < cutoff:
-                            continue
-                    except Exception:
-                        pass
+                if _published_before(article.get("publishedAt"), cutoff, cutoff_iso):
+                    continue
                 articles.append(
                     {
                         "title": article.get("title", ""),
@@ -521,12 +635,16 @@ def get_crypto_news():
                 "publishedAt": now,
             },
         ]
-        print(f"[DEMO] Using {len(articles)} demo news articles")
+        logger.info(f"[DEMO] Using {len(articles)} demo news articles")
 
     # RSS Feeds (only if not demo mode)
     if NEWS_API_KEY:
-        for name, url in CRYPTO_NEWS_SOURCES:
-            items = fetch_rss_feed(url)
+        # Feeds are network-bound: fetch them concurrently, keep source order
+        with ThreadPoolExecutor(max_workers=RSS_FETCH_WORKERS) as executor:
+            feeds = list(
+                executor.map(fetch_rss_feed, [url for _, url in CRYPTO_NEWS_SOURCES])
+            )
+        for (name, _), items in zip(CRYPTO_NEWS_SOURCES, feeds):
             for item in items[:15]:  # Limit to 15 most recent per source
                 articles.append(
                     {
@@ -537,30 +655,90 @@ def get_crypto_news():
                     }
                 )
 
-    # Basic sorting (demo or real)
-    articles = sort_articles_by_time(articles)
-    print(
+    # The same headline often arrives from several feeds - analyze it once
+    articles = sort_articles_by_time(dedupe_articles(articles))
+    logger.info(
         f"Fetched {len(articles)} news articles ({'demo' if not NEWS_API_KEY else 'live'})"
     )
     return articles
 
 
+# One alternation over every alias (longest first) - a single scan per text
+# instead of one regex search per alias. Aliases are whole words, so the
+# \b anchors make this match exactly the per-alias searches it replaces.
+# "$" is not a word character, so $SYMBOL cashtags match here as well.
+_SYMBOL_RE = re.compile(
+    r"\b("
+    + "|".join(map(re.escape, sorted(CRYPTO_SYMBOL_MAP, key=len, reverse=True)))
+    + r")\b"
+)
+
+
 def extract_crypto_symbols(text):
-    """Extract cryptocurrency symbols from text"""
-    text_upper = text.upper()
-    found = set()
+    """Extract cryptocurrency symbols (names, tickers and $TICKER tags) from text"""
+    return list({CRYPTO_SYMBOL_MAP[m] for m in _SYMBOL_RE.findall(text.upper())})
+
+
+# Social sentiment is market-wide: fetch it once and share it across symbols
+SOCIAL_SENTIMENT_TTL_SECONDS = 60
+_social_monitor = None
+_social_cache = {"at": 0.0, "data": None}
+_social_lock = threading.Lock()
+
+
+def clear_social_cache():
+    """Forget the cached social sentiment and the monitor instance for this process"""
+    global _social_monitor
+    with _social_lock:
+        _social_monitor = None
+        _social_cache.update(at=0.0, data=None)
+
+
+def get_social_sentiment():
+    """Aggregated social sentiment, reused for SOCIAL_SENTIMENT_TTL_SECONDS"""
+    global _social_monitor
+    # Held across the fetch so concurrent symbol threads wait for one result
+    with _social_lock:
+        now = time.monotonic()
+        if (
+            _social_cache["data"] is not None
+            and now - _social_cache["at"] < SOCIAL_SENTIMENT_TTL_SECONDS
+        ):
+            return _social_cache["data"]
+        if _social_monitor is None:
+            _social_monitor = SocialMediaMonitor()
+        data = aggregate_social_sentiment(_social_monitor.get_all_social_signals())
+        _social_cache.update(at=now, data=data)
+        return data
 
-    # Check all known symbols and aliases
-    for symbol, yf_symbol in CRYPTO_SYMBOL_MAP.items():
-        if re.search(r"\b" + re.escape(symbol) + r"\b", text_upper):
-            found.add(yf_symbol)
 
-    # Check for $SYMBOL patterns
-    for match in re.findall(r"\$([A-Z]{2,6})\b", text_upper):
-        if match in CRYPTO_SYMBOL_MAP:
-            found.add(CRYPTO_SYMBOL_MAP[match])
+# Sentiment prompt, built once; only the subject and article list vary per call
+# Optimized prompt for better sentiment analysis with gpt-5o-mini/bidara
+_SENTIMENT_PROMPT = """You are a cryptocurrency market analyst. Analyze these recent news articles about {subject}.
 
-    return list(found)
+NEWS ARTICLES:
+{articles}
+
+TASK: Provide a precise sentiment analysis with clear reasoning.
+
+SENTIMENT SCORE: Rate from -1.0 (very bearish) to +1.0 (very bullish)
+- Consider: price movement catalysts, adoption news, regulatory impact, market sentiment
+- Negative events (hacks, bans, crashes): -0.7 to -1.0
+- Slightly negative: -0.3 to -0.6
+- Neutral: -0.2 to +0.2
+- Slightly positive: +0.3 to +0.6
+- Very positive (major adoption, breakthroughs): +0.7 to +1.0
+
+REASONING: Explain in 2-3 clear sentences why this score is appropriate.
+
+FORMAT YOUR RESPONSE EXACTLY LIKE THIS:
+SCORE: [single number between -1.0 and 1.0]
+REASON: [your 2-3 sentence explanation]"""
+
+_SENTIMENT_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a cryptocurrency market sentiment analyzer. Analyze news and provide sentiment scores between -1.0 (very bearish) and +1.0 (very bullish). If your model outputs values in the -100..+100 range, the signal generator will automatically normalize them to [-1.0, +1.0].",
+}
 
 
 def analyze_sentiment_with_llm(articles, symbol=""):
@@ -569,11 +747,11 @@ def analyze_sentiment_with_llm(articles, symbol=""):
     If LLM is unavailable, returns None to indicate no trade should be made
     """
     if not llm_client:
-        print("[AI] No LLM client available - cannot generate signals")
+        logger.warning("[AI] No LLM client available - cannot generate signals")
         return None, "AI unavailable - no trade signals"
 
     if not articles:
-        print("[AI] No articles provided - cannot generate signals")
+        logger.info("[AI] No articles provided - cannot generate signals")
         return None, "No articles available"
 
     # Get news cache
@@ -584,67 +762,41 @@ def analyze_sentiment_with_llm(articles, symbol=""):
 
     # If we have cached articles, use them
     if cached_articles:
-        print(
+        logger.info(
             f"[CACHE] Using {len(cached_articles)} cached AI analyses (saving API calls)"
         )
 
     # Check if we have ANY articles to work with
     if not new_articles and not cached_articles:
-        print("[AI] No new or cached articles to analyze")
+        logger.info("[AI] No new or cached articles to analyze")
         return None, "No news articles available"
 
+    # Start from the cached results
+    all_scores = [cached["sentiment_score"] for cached in cached_articles]
+    all_reasons = [cached["reasoning"] for cached in cached_articles]
+
     # If ONLY cached articles and NO new articles, just use cached results
-    if not new_articles and cached_articles:
-        all_scores = [cached["sentiment_score"] for cached in cached_articles]
-        all_reasons = [cached["reasoning"] for cached in cached_articles]
+    if not new_articles:
         avg_score = sum(all_scores) / len(all_scores)
         combined_reason = " | ".join(all_reasons[:3])
         return avg_score, combined_reason
 
-    all_scores = []
-    all_reasons = []
-
-    # Add cached results
-    for cached in cached_articles:
-        all_scores.append(cached["sentiment_score"])
-        all_reasons.append(cached["reasoning"])
-
     # Analyze new articles if any
     if new_articles:
-        print(
+        logger.info(
             f"[AI] Analyzing {len(new_articles)} new articles with Multi-Provider LLM"
         )
 
         # Prepare article summaries for NEW articles only
-        article_texts = []
-        for i, article in enumerate(new_articles, 1):
-            title = article.get("title", "")
-            desc = article.get("description", "")
-            article_texts.append(f"{i}. {title}\n   {desc[:200]}")
-
-        combined_text = "\n".join(article_texts)
-
-        # Optimized prompt for better sentiment analysis with gpt-5o-mini/bidara
-        prompt = f"""You are a cryptocurrency market analyst. Analyze these recent news articles about {symbol if symbol else "the crypto market"}.
-
-NEWS ARTICLES:
-{combined_text}
-
-TASK: Provide a precise sentiment analysis with clear reasoning.
-
-SENTIMENT SCORE: Rate from -1.0 (very bearish) to +1.0 (very bullish)
-- Consider: price movement catalysts, adoption news, regulatory impact, market sentiment
-- Negative events (hacks, bans, crashes): -0.7 to -1.0
-- Slightly negative: -0.3 to -0.6
-- Neutral: -0.2 to +0.2
-- Slightly positive: +0.3 to +0.6
-- Very positive (major adoption, breakthroughs): +0.7 to +1.0
-
-REASONING: Explain in 2-3 clear sentences why this score is appropriate.
-
-FORMAT YOUR RESPONSE EXACTLY LIKE THIS:
-SCORE: [single number between -1.0 and 1.0]
-REASON: [your 2-3 sentence explanation]"""
+        combined_text = "\n".join(
+            [
+                f"{i}. {article.get('title', '')}\n   {article.get('description', '')[:200]}"
+                for i, article in enumerate(new_articles, 1)
+            ]
+        )
+        prompt = _SENTIMENT_PROMPT.format(
+            subject=symbol if symbol else "the crypto market", articles=combined_text
+        )
 
         try:
             # Use multi-provider LLM with automatic failover
@@ -652,10 +804,7 @@ REASON: [your 2-3 sentence explanation]"""
             if hasattr(llm_client, "chat"):
                 result = llm_client.chat(  # type: ignore[attr-defined]
                     messages=[
-                        {
-                            "role": "system",
-                            "content": "You are a cryptocurrency market sentiment analyzer. Analyze news and provide sentiment scores between -1.0 (very bearish) and +1.0 (very bullish). If your model outputs values in the -100..+100 range, the signal generator will automatically normalize them to [-1.0, +1.0].",
-                        },
+                        _SENTIMENT_SYSTEM_MESSAGE,
                         {"role": "user", "content": prompt},
                     ]
                 )
@@ -666,17 +815,17 @@ REASON: [your 2-3 sentence explanation]"""
 
             # Check if result is None
             if result is None:
-                print("[AI] No response from LLM - cannot generate signals")
+                logger.warning("[AI] No response from LLM - cannot generate signals")
                 # Don't cache errors - return None to skip this symbol
                 return None, "AI failed to respond"
 
             # Parse response
-            score_match = re.search(r"SCORE:\s*([-+]?[0-9]*\.?[0-9]+)", result)
-            reason_match = re.search(r"REASON:\s*(.+)", result, re.S)
+            score_match = _SCORE_RE.search(result)
+            reason_match = _REASON_RE.search(result)
 
             if not score_match:
-                print("[AI] Could not parse AI response - cannot generate signals")
-                print(f"[DEBUG] Response was: {result[:200]}")
+                logger.warning("[AI] Could not parse AI response - cannot generate signals")
+                logger.debug(f"[AI] Response was: {result[:200]}")
                 # Don't cache parse errors - return None to skip this symbol
                 return None, "AI response parse error"
 
@@ -728,12 +877,10 @@ REASON: [your 2-3 sentence explanation]"""
 
         # Get social media sentiment
         try:
-            social_monitor = SocialMediaMonitor()
-            social_signals = social_monitor.get_all_social_signals()
-            social_sentiment_data = aggregate_social_sentiment(social_signals)
+            social_sentiment_data = get_social_sentiment()
             social_sentiment = social_sentiment_data["sentiment_score"]
 
-            print(
+            logger.info(
                 f"[SOCIAL] News sentiment: {news_sentiment:.3f}, Social sentiment: {social_sentiment:.3f}"
             )
 
@@ -747,13 +894,14 @@ REASON: [your 2-3 sentence explanation]"""
             return combined_sentiment, combined_reason
 
         except Exception as e:
-            print(f"[SOCIAL] Error getting social sentiment: {e}")
-            print("[SOCIAL] Falling back to news-only sentiment")
+            logger.warning(
+                f"[SOCIAL] Error getting social sentiment: {e} - falling back to news-only sentiment"
+            )
             # Fall back to news-only sentiment if social fails
             return news_sentiment, combined_reason
 
     # Should not reach here, but handle edge case
-    print("[AI] No AI analysis results available")
+    logger.warning("[AI] No AI analysis results available")
     return None, "No AI analysis available"
 
 
@@ -773,34 +921,160 @@ def safe_last(series):
         return None
 
 
-@lru_cache(maxsize=200)
-def get_market_data(symbol, period="30d", interval="1h"):
+# Disk cache of computed market data, shared across cron runs. Keys carry the
+# candle index, so entries expire by themselves when a new 1h bar opens.
+# Stored as plain JSON (never unpickled), and callers always get their own copy.
+MARKET_CACHE_BAR_SECONDS = 3600
+_market_cache = None
+_market_cache_dirty = False  # stored since the last save_market_cache()
+_market_cache_lock = threading.Lock()
+
+
+def _market_cache_key(symbol, period, interval):
+    return (symbol, period, interval, int(time.time()) // MARKET_CACHE_BAR_SECONDS)
+
+
+def _get_market_cache():
+    """Load the on-disk cache once per process, dropping entries from older bars"""
+    global _market_cache
+    if _market_cache is None:
+        bar = int(time.time()) // MARKET_CACHE_BAR_SECONDS
+        try:
+            with open(MARKET_DATA_CACHE_FILE, "r") as f:
+                entries = json.load(f)
+            _market_cache = {
+                (symbol, period, interval, entry_bar): result
+                for symbol, period, interval, entry_bar, result in entries
+                if entry_bar == bar
+            }
+        except (OSError, ValueError, TypeError):
+            _market_cache = {}
+    return _market_cache
+
+
+def clear_market_cache():
+    """Forget cached market data for this process (the disk copy is left alone)"""
+    global _market_cache, _market_cache_dirty
+    with _market_cache_lock:
+        _market_cache = {}
+        _market_cache_dirty = False
+
+
+def get_cached_market_data(symbol, period="30d", interval="1h"):
+    """Market data computed earlier in the current bar (this or a previous run), or None"""
+    with _market_cache_lock:
+        cached = _get_market_cache().get(_market_cache_key(symbol, period, interval))
+    return copy.deepcopy(cached)
+
+
+def store_market_data(symbol, result, period="30d", interval="1h"):
+    """Record computed market data for the current bar (persisted by save_market_cache)"""
+    global _market_cache_dirty
+    if result is None:
+        return
+    result = copy.deepcopy(result)  # Later changes by the caller must not leak in
+    with _market_cache_lock:
+        _get_market_cache()[_market_cache_key(symbol, period, interval)] = result
+        _market_cache_dirty = True
+
+
+def _json_default(obj):
+    """numpy scalars/arrays in indicator output -> plain JSON values"""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"{type(obj).__name__} is not JSON serializable")
+
+
+def save_market_cache():
+    """Write the market data cache to disk once if anything was stored since the last save"""
+    global _market_cache_dirty
+    with _market_cache_lock:
+        if not _market_cache_dirty:
+            return
+        _market_cache_dirty = False
+        entries = [list(key) + [result] for key, result in _market_cache.items()]
+    try:
+        tmp_file = MARKET_DATA_CACHE_FILE + ".tmp"
+        with open(tmp_file, "w") as f:
+            json.dump(entries, f, separators=(",", ":"), default=_json_default)
+        os.replace(tmp_file, MARKET_DATA_CACHE_FILE)
+    except Exception as e:
+        logger.debug(f"Could not save market data cache: {e}")
+
+
+# Backstop for entries stored after main() saved (e.g. the debug path)
+atexit.register(save_market_cache)
+
+
+MARKET_DATA_BATCH_SIZE = 20
+
+
+def prefetch_market_data(symbols, period="30d", interval="1h"):
     """
-    Fetch market data and calculate candlestick pattern analysis
-    Optimized for 2-hour trading timeframe:
-    - 1h candles: Yahoo Finance doesn't support 2h, using 1h for short-term pattern detection
-    - 30 days history: ~720 candles for reliable pattern analysis
+    Download OHLCV history for many symbols with batched yf.download calls
+    (one HTTP round-trip per MARKET_DATA_BATCH_SIZE tickers instead of one per
+    ticker). Returns {yf_symbol: DataFrame}; symbols that failed are omitted so
+    callers can fall back to get_market_data().
     """
-    try:
-        ticker = yf.Ticker(symbol)
-        df = ticker.history(period=period, interval=interval)
+    import yfinance as yf
 
-        if df.empty or len(df) < 50:  # Need at least 50 candles for patterns
+    frames = {}
+    # Yahoo accepts ~20 tickers per download request
+    for start in range(0, len(symbols), MARKET_DATA_BATCH_SIZE):
+        chunk = symbols[start : start + MARKET_DATA_BATCH_SIZE]
+        try:
+            data = yf.download(
+                tickers=" ".join(chunk),
+                period=period,
+                interval=interval,
+                group_by="ticker",
+                auto_adjust=True,
+                threads=True,
+                progress=False,
+            )
+        except Exception as e:
+            logger.error(f"Batch market data error for {chunk}: {e}")
+            continue
+        if data is None or data.empty:
+            continue
+
+        multi = isinstance(data.columns, pd.MultiIndex)
+        for symbol in chunk:
+            if multi:
+                if symbol not in data.columns.get_level_values(0):
+                    continue
+                df = data[symbol]
+            else:
+                df = data  # Single-ticker download comes back with flat columns
+            df = df.dropna(how="all")
+            if not df.empty:
+                frames[symbol] = df
+    return frames
+
+
+def compute_market_features(df, symbol=""):
+    """
+    Calculate price, volatility and candlestick pattern analysis from an
+    OHLCV DataFrame (shared by the batched and single-ticker fetch paths)
+    """
+    try:
+        if df is None or df.empty or len(df) < 50:  # Need at least 50 candles for patterns
             return None
 
-        close = df["Close"]
-        # Convert to pandas Series if needed so that .pct_change() and similar work reliably
-        if not hasattr(close, "pct_change"):
-            close = pd.Series(np.asarray(close))
-        last_close_val = safe_last(close)
-        if last_close_val is None:
+        closes = np.asarray(df["Close"], dtype=np.float64)
+        # Batched downloads pad bars missing for one ticker with NaN - price off the last real close
+        valid_closes = closes[np.isfinite(closes)]
+        if valid_closes.size == 0:
             return None
-        current_price = float(last_close_val)
+        current_price = float(valid_closes[-1])
 
-        # Calculate volatility (annualized for 1h candles)
-        returns = close.pct_change()
+        # Calculate volatility (annualized for 1h candles) on the raw ndarray;
+        # nanstd with ddof=1 matches the pandas pct_change().std() it replaces
+        returns = np.diff(closes) / closes[:-1]
         # 1h candles = 24 periods per day, 365 days
-        volatility = float(returns.std() * np.sqrt(24 * 365))
+        volatility = float(np.nanstd(returns, ddof=1) * math.sqrt(24 * 365))
 
         # Get candlestick pattern analysis (FREE, no API calls)
         indicators = get_all_candlestick_indicators(df)
@@ -808,11 +1082,16 @@ def get_market_data(symbol, period="30d", interval="1h"):
         # Extract ATR percentage for stop loss calculations
         atr_pct = indicators["atr"]["percent"]
 
+        # Partition signals once here (cached with the data) instead of in every consumer
+        signals, strong_signals = summarize_indicator_signals(indicators)
+
         return {
             "price": current_price,
             "volatility": volatility,
             "atr_pct": atr_pct,
             "indicators": indicators,
+            "signals": signals,
+            "strong_signals": strong_signals,
         }
 
     except Exception as e:
@@ -820,6 +1099,49 @@ def get_market_data(symbol, period="30d", interval="1h"):
         return None
 
 
+def get_market_data(symbol, period="30d", interval="1h"):
+    """
+    Fetch market data and calculate candlestick pattern analysis
+    Optimized for 2-hour trading timeframe:
+    - 1h candles: Yahoo Finance doesn't support 2h, using 1h for short-term pattern detection
+    - 30 days history: ~720 candles for reliable pattern analysis
+    Single-ticker path; main() prefetches all symbols with prefetch_market_data().
+    Results are cached per 1h bar (memory + disk), so they expire when a new candle opens.
+    """
+    import yfinance as yf
+
+    cached = get_cached_market_data(symbol, period, interval)
+    if cached is not None:
+        return cached
+    try:
+        ticker = yf.Ticker(symbol)
+        df = ticker.history(period=period, interval=interval)
+    except Exception as e:
+        logger.error(f"Market data error for {symbol}: {e}")
+        return None
+    result = compute_market_features(df, symbol)
+    store_market_data(symbol, result, period, interval)
+    return result
+
+
+# Indicator weights frozen into parallel arrays (one slot per weighted indicator)
+_INDICATOR_KEYS = tuple(INDICATOR_WEIGHTS)
+_INDICATOR_WEIGHTS_ARR = np.fromiter(
+    INDICATOR_WEIGHTS.values(), dtype=np.float64, count=len(_INDICATOR_KEYS)
+)
+
+
+@njit("float64(float64[:], float64[:])", cache=True)
+def _weighted_tech_score(signals, weights):
+    """Weighted mean of indicator signals (missing indicators carry weight 0)"""
+    score = 0.0
+    total = 0.0
+    for i in range(signals.shape[0]):
+        score += signals[i] * weights[i]
+        total += weights[i]
+    return score / total if total > 0 else 0.0
+
+
 def calculate_trade_signal(
     sentiment_score, news_count, market_data, symbol="", news_articles=None
 ):
@@ -867,31 +1189,34 @@ def calculate_trade_signal(
     expected_return += news_bonus if sentiment_score > 0 else -news_bonus
 
     # Candlestick pattern score (weighted combination with dynamic optimization)
-    tech_score = 0
-    total_weight = 0
-
-    for indicator, weight in INDICATOR_WEIGHTS.items():
-        if indicator in indicators and "signal" in indicators[indicator]:
+    n_keys = len(_INDICATOR_KEYS)
+    signals_arr = np.zeros(n_keys)
+    weights_arr = np.zeros(n_keys)
+    for i, indicator in enumerate(_INDICATOR_KEYS):
+        data = indicators.get(indicator)
+        if data is not None and "signal" in data:
             # Apply dynamic weight multiplier from learning system
             weight_multiplier = (
                 market_analyzer.get_indicator_weight_multiplier(indicator)
                 if market_analyzer
                 else 1.0
             )
-            adjusted_weight = weight * weight_multiplier
-
-            tech_score += indicators[indicator]["signal"] * adjusted_weight
-            total_weight += adjusted_weight
+            signals_arr[i] = data["signal"]
+            weights_arr[i] = _INDICATOR_WEIGHTS_ARR[i] * weight_multiplier
 
-    tech_score_normalized = tech_score / total_weight if total_weight > 0 else 0
+    tech_score_normalized = _weighted_tech_score(signals_arr, weights_arr)
 
     # Get LLM analysis if available
     llm_analysis = None
     if market_analyzer and news_articles:
-        sentiment_data = {"score": sentiment_score, "count": news_count}
-        llm_analysis = market_analyzer.analyze_with_llm(
-            symbol, market_data, sentiment_data, news_articles
-        )
+        if market_analyzer.should_consult_llm(tech_score_normalized, sentiment_score):
+            sentiment_data = {"score": sentiment_score, "count": news_count}
+            llm_analysis = market_analyzer.analyze_with_llm(
+                symbol, market_data, sentiment_data, news_articles
+            )
+        else:
+            # Unambiguous setup - combine_analyses takes the no-LLM path
+            llm_analysis = {"llm_available": False, "skipped": "unambiguous"}
 
     # Combine all analyses
     combined = (
@@ -1095,43 +1420,50 @@ def log_trade(symbol, signal, sentiment_reason="", indicators_data=None):
         "indicators": indicators_data,  # Store for learning
     }
 
-    # Load existing logs
-    try:
-        with open(TRADE_LOG_FILE, "r") as f:
-            logs = json.load(f)
-    except Exception as e:
-        logger.debug(f"Could not read {TRADE_LOG_FILE}: {e}")
-        logs = []
+    # Append-only log: one line per trade, no read/rewrite of the history
+    append_trade(trade_entry)
+
 
-    logs.append(trade_entry)
+# Parsed daily risk file, reused while its mtime is unchanged
+_RISK_CACHE = {"mtime": None, "data": None}
 
-    # Save logs
-    with open(TRADE_LOG_FILE, "w") as f:
-        json.dump(logs, f, indent=2)
+
+def _load_daily_risk():
+    """Parsed DAILY_RISK_FILE (re-read only when the file changes), or None"""
+    try:
+        mtime = os.stat(DAILY_RISK_FILE).st_mtime
+    except OSError:
+        return None  # No risk file yet - nothing recorded today
+    if mtime == _RISK_CACHE["mtime"]:
+        return _RISK_CACHE["data"]
+    try:
+        with open(DAILY_RISK_FILE, "r") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Could not parse {DAILY_RISK_FILE}, ignoring daily risk: {e}")
+        data = None
+    _RISK_CACHE.update(mtime=mtime, data=data)
+    return data
 
 
 def check_daily_risk():
     """Check if daily risk limit has been reached"""
+    risk_data = _load_daily_risk()
+    if not isinstance(risk_data, dict):
+        return False
+    if risk_data.get("date") != datetime.now().date().isoformat():
+        return False
+
+    adaptive_limit = None
     try:
-        with open(DAILY_RISK_FILE, "r") as f:
-            risk_data = json.load(f)
-            today = datetime.now().date().isoformat()
-            if risk_data.get("date") == today:
-                adaptive_limit = None
-                try:
-                    if market_analyzer:
-                        adaptive_limit = market_analyzer.get_adjusted_parameters().get(
-                            "daily_risk_limit"
-                        )
-                except Exception:
-                    adaptive_limit = None
-                limit_to_use = (
-                    adaptive_limit if adaptive_limit is not None else DAILY_RISK_LIMIT
-                )
-                return risk_data.get("loss_pct", 0) >= limit_to_use
-    except Exception as e:
-        logger.debug(f"Could not read {DAILY_RISK_FILE}: {e}")
-    return False
+        if market_analyzer:
+            adaptive_limit = market_analyzer.get_adjusted_parameters().get(
+                "daily_risk_limit"
+            )
+    except Exception:
+        adaptive_limit = None
+    limit_to_use = adaptive_limit if adaptive_limit is not None else DAILY_RISK_LIMIT
+    return risk_data.get("loss_pct", 0) >= limit_to_use
 
 
 def get_current_price_robust(symbol):
@@ -1139,6 +1471,8 @@ def get_current_price_robust(symbol):
     Get current price using multiple fallback sources
     Priority: Yahoo Finance -> CoinGecko API -> Return None
     """
+    import yfinance as yf
+
     # First try Yahoo Finance
     try:
         yf_symbol = CRYPTO_SYMBOL_MAP.get(symbol, f"{symbol}-USD")
@@ -1173,7 +1507,7 @@ def get_current_price_robust(symbol):
         cg_id = coingecko_ids.get(symbol.upper())
         if cg_id:
             url = f"https://api.coingecko.com/api/v3/simple/price?ids={cg_id}&vs_currencies=usd"
-            response = requests.get(url, timeout=10)
+            response = _HTTP.get(url, timeout=10)
             if response.status_code == 200:
                 data = response.json()
                 if cg_id in data and "usd" in data[cg_id]:
@@ -1184,6 +1518,11 @@ def get_current_price_robust(symbol):
     return None
 
 
+def _first_touch(hits):
+    """Index of the first True in a boolean bar array, or -1 if none"""
+    return int(hits.argmax()) if hits.any() else -1
+
+
 def check_trade_outcomes():
     """
     Check open trades and verify if predictions were correct
@@ -1198,8 +1537,7 @@ def check_trade_outcomes():
     """
     print("[DEBUG] Starting trade outcome check...")
     try:
-        with open(TRADE_LOG_FILE, "r") as f:
-            logs = json.load(f)
+        logs = load_trade_log()
         print(f"[DEBUG] Loaded {len(logs)} trades from log file")
     except FileNotFoundError:
         print(f"[DEBUG] No trade log file found at {TRADE_LOG_FILE}")
@@ -1213,6 +1551,19 @@ def check_trade_outcomes():
     verified_count = 0
     queued_count = 0
 
+    # Fetch INTRADAY price history for every pending trade in one batched download
+    # (5 days of 1h data covers the entry time window)
+    pending_symbols = {
+        CRYPTO_SYMBOL_MAP.get(t["symbol"], f"{t['symbol']}-USD")
+        for t in logs
+        if t.get("status") in ["open", "queued"] and "check_time" in t and "timestamp" in t
+    }
+    history = (
+        prefetch_market_data(sorted(pending_symbols), period="5d", interval="1h")
+        if pending_symbols
+        else {}
+    )
+
     for trade in logs:
         actual_profit = 0
         failure_reason = None
@@ -1232,16 +1583,14 @@ def check_trade_outcomes():
         if time_elapsed < 2.0:
             continue
 
-        # Fetch INTRADAY price history to track actual movements
+        # Intraday price history to track actual movements
         symbol = trade["symbol"]
         yf_symbol = CRYPTO_SYMBOL_MAP.get(symbol, f"{symbol}-USD")
 
         try:
-            ticker = yf.Ticker(yf_symbol)
-            # Fetch 5 days of 1h data to ensure we have the entry time window
-            intraday_data = ticker.history(period="5d", interval="1h")
+            intraday_data = history.get(yf_symbol)
 
-            if intraday_data.empty:
+            if intraday_data is None:
                 # Yahoo Finance failed, try robust price fetching
                 current_price = get_current_price_robust(symbol)
                 if current_price is None:
@@ -1258,45 +1607,36 @@ def check_trade_outcomes():
                 ]
 
                 if trade_window.empty:
-                    # Fallback to single point check if no intraday data
-                    current_data = ticker.history(period="1d", interval="1h")
-                    if current_data.empty:
-                        # Try robust fetching as last resort
-                        current_price = get_current_price_robust(symbol)
-                        if current_price is None:
-                            continue  # Skip this trade if no price data available
-                        # For fallback, assume entry was reached and use current price for high/low
-                        entry_reached = True
-                        high_price = current_price
-                        low_price = current_price
-                        trade_window = None
-                    else:
-                        last_close_val = safe_last(current_data["Close"])
-                        if last_close_val is None:
-                            continue
-                        current_price = float(last_close_val)
-                        entry_reached = True  # Assume entry reached if no data
-                        high_price = current_price
-                        low_price = current_price
-                        trade_window = None
+                    # Fallback to single point check (latest close) if no bars in the window
+                    last_close_val = safe_last(intraday_data["Close"])
+                    if last_close_val is None:
+                        continue
+                    current_price = float(last_close_val)
+                    entry_reached = True  # Assume entry reached if no data
+                    high_price = current_price
+                    low_price = current_price
+                    trade_window = None
                 else:
                     last_close_val = safe_last(trade_window["Close"])
                     if last_close_val is None:
                         continue
                     current_price = float(last_close_val)
-                    high_price = float(trade_window["High"].max())
-                    low_price = float(trade_window["Low"].min())
+                    highs = trade_window["High"].to_numpy(dtype=np.float64)
+                    lows = trade_window["Low"].to_numpy(dtype=np.float64)
+                    high_price = float(np.nanmax(highs))
+                    low_price = float(np.nanmin(lows))
 
-                    # Check if entry price was actually reached
+                    # Check if (and on which bar) entry price was actually reached
                     entry_price = trade["entry_price"]
                     direction = trade["direction"]
 
                     if direction == "LONG":
                         # For LONG, entry needs to be reached from above (price needs to dip to/below entry)
-                        entry_reached = low_price <= entry_price
+                        entry_idx = _first_touch(lows <= entry_price)
                     else:  # SHORT
                         # For SHORT, entry needs to be reached from below (price needs to rise to/above entry)
-                        entry_reached = high_price >= entry_price
+                        entry_idx = _first_touch(highs >= entry_price)
+                    entry_reached = entry_idx >= 0
 
             entry_price = trade["entry_price"]
             direction = trade["direction"]
@@ -1350,7 +1690,20 @@ def check_trade_outcomes():
                 continue
 
             # 2. Entry WAS reached - check if SL or TP were hit during the window
-            if direction == "LONG":
+            if trade_window is not None:
+                # From the entry fill bar on, whichever level is touched first closes the trade
+                highs_after = highs[entry_idx:]
+                lows_after = lows[entry_idx:]
+                if direction == "LONG":
+                    sl_idx = _first_touch(lows_after <= stop_loss)
+                    tp_idx = _first_touch(highs_after >= take_profit)
+                else:  # SHORT
+                    sl_idx = _first_touch(highs_after >= stop_loss)
+                    tp_idx = _first_touch(lows_after <= take_profit)
+                # Both touched in the same bar: order unknown, assume the stop filled first
+                sl_hit_during_window = sl_idx >= 0 and (tp_idx < 0 or sl_idx <= tp_idx)
+                tp_hit_during_window = tp_idx >= 0 and not sl_hit_during_window
+            elif direction == "LONG":
                 sl_hit_during_window = low_price <= stop_loss
                 tp_hit_during_window = high_price >= take_profit
             else:  # SHORT
@@ -1473,8 +1826,7 @@ def check_trade_outcomes():
 
     # Save updated logs
     if updated:
-        with open(TRADE_LOG_FILE, "w") as f:
-            json.dump(logs, f, indent=2)
+        write_trade_log(logs)
 
         if verified_count > 0:
             print(
@@ -1600,8 +1952,7 @@ def display_learning_status():
 
         # Check pending trades
         try:
-            with open(TRADE_LOG_FILE, "r") as f:
-                logs = json.load(f)
+            logs = load_trade_log()
             open_trades = len(
                 [t for t in logs if t.get("status") in ["open", "queued"]]
             )
@@ -1650,12 +2001,9 @@ def display_learning_status():
         )
 
         # Win rate if available
-        if total_trades >= 5 and hasattr(market_analyzer, "performance_history"):
-            recent = market_analyzer.performance_history[-20:]
-            if recent:
-                wins = sum(1 for t in recent if t["result"].get("profit", 0) > 0)
-                win_rate = wins / len(recent)
-                print(f"\n[PERFORMANCE] Recent Win Rate: {win_rate * 100:.1f}%")
+        if total_trades >= 5 and market_analyzer.performance_history:
+            win_rate = market_analyzer.get_performance_summary()["win_rate"]
+            print(f"\n[PERFORMANCE] Recent Win Rate: {win_rate * 100:.1f}%")
 
         print("=" * 70 + "\n")
     except Exception as e:
@@ -1746,14 +2094,30 @@ def main():
         f"[ANALYZE] Analyzing {len(symbol_articles)} cryptocurrencies: {list(symbol_articles.keys())}\n"
     )
 
+    # Fetch OHLCV history up front in batched requests (skipping symbols already
+    # computed during the current bar by an earlier run)
+    market_frames = prefetch_market_data(
+        [s for s in symbol_articles if get_cached_market_data(s) is None]
+    )
+
+    def market_data_for(yf_symbol):
+        df = market_frames.get(yf_symbol)
+        if df is None:
+            # Cached for this bar, or missing from the batch - single-ticker fetch
+            return get_market_data(yf_symbol)
+        result = compute_market_features(df, yf_symbol)
+        store_market_data(yf_symbol, result)
+        return result
+
     # Analyze symbols in parallel for better performance
     signals = analyze_multiple_symbols_parallel(
         symbol_articles=symbol_articles,
-        get_market_data_func=get_market_data,
+        get_market_data_func=market_data_for,
         analyze_sentiment_func=analyze_sentiment_with_llm,
         calculate_signal_func=calculate_trade_signal,
         max_workers=8,  # Use 8 parallel workers for optimal performance
     )
+    save_market_cache()  # One disk write for every symbol computed above
 
     print(f"\n[PARALLEL] Analysis complete. Found {len(signals)} signals.")
 
@@ -1772,7 +2136,7 @@ def main():
         print(f"[DEBUG] Testing {test_symbol} manually...")
 
         try:
-            market_data = get_market_data(test_symbol)
+            market_data = market_data_for(test_symbol)
             if market_data:
                 print(
                     f"[DEBUG] Market data OK for {test_symbol}: ${market_data['price']:.2f}"
@@ -1890,8 +2254,7 @@ def main():
 
     # Debug: Check if trades were logged
     try:
-        with open(TRADE_LOG_FILE, "r") as f:
-            logged_trades = json.load(f)
+        logged_trades = load_trade_log()
         print(
             f"[DEBUG] Successfully logged {len(logged_trades)} total trades to {TRADE_LOG_FILE}"
         )
@@ -1,38 +1,46 @@
-import json
+import importlib.util
 import os
-from typing import List, Dict, Any, Optional
+from typing import TYPE_CHECKING, List, Dict, Any, Optional
 from datetime import datetime
 
 import numpy as np
 import pandas as pd
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.preprocessing import StandardScaler
-from sklearn.metrics import accuracy_score
-import joblib
+
+if TYPE_CHECKING:
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.preprocessing import StandardScaler
 
 from config import (
     ML_MODEL_FILE,
     ML_SCALER_FILE,
     ML_MIN_CONFIDENCE,
-    ML_RETRAIN_THRESHOLD,
-    TRADE_LOG_FILE
+    ML_RETRAIN_THRESHOLD
 )
+from trade_log import load_trade_log
+
+# sklearn/joblib are heavy: import them on first load/train, not when this module loads
+ML_LIBS_AVAILABLE = all(importlib.util.find_spec(name) for name in ("joblib", "sklearn"))
 
 class TradeOutcomeModel:
     """RandomForest-based model predicting probability a trade will be profitable.
-    Trains incrementally on closed trades from TRADE_LOG_FILE.
+    Trains incrementally on closed trades from the trade log (trade_log.load_trade_log).
     """
 
     def __init__(self):
-        self.model: Optional[RandomForestClassifier] = None
-        self.scaler: Optional[StandardScaler] = None
+        self.model: Optional["RandomForestClassifier"] = None
+        self.scaler: Optional["StandardScaler"] = None
         self.last_train_count: int = 0
         self._prob_cache: Dict[Any, float] = {}
         self._cache_max = 500
-        self._load()
+        self._loaded = False  # saved model is read on first prediction
 
     def _load(self):
+        if self._loaded:
+            return
+        self._loaded = True
         try:
+            import joblib
+
             if os.path.exists(ML_MODEL_FILE):
                 self.model = joblib.load(ML_MODEL_FILE)
             if os.path.exists(ML_SCALER_FILE):
@@ -42,17 +50,16 @@ class TradeOutcomeModel:
             self.scaler = None
 
     def _save(self):
+        import joblib
+
         if self.model:
             joblib.dump(self.model, ML_MODEL_FILE)
         if self.scaler:
             joblib.dump(self.scaler, ML_SCALER_FILE)
 
     def _load_dataset(self) -> pd.DataFrame:
-        if not os.path.exists(TRADE_LOG_FILE):
-            return pd.DataFrame()
         try:
-            with open(TRADE_LOG_FILE, 'r') as f:
-                data = json.load(f)
+            data = load_trade_log()
         except Exception:
             return pd.DataFrame()
 
@@ -85,6 +92,10 @@ class TradeOutcomeModel:
         if not force and self.last_train_count == len(df):
             return False
 
+        from sklearn.ensemble import RandomForestClassifier
+        from sklearn.metrics import accuracy_score
+        from sklearn.preprocessing import StandardScaler
+
         X = df.drop('label', axis=1).to_numpy()
         y = df['label'].to_numpy()
 
@@ -106,6 +117,7 @@ class TradeOutcomeModel:
         preds = self.model.predict(X_scaled)
         acc = accuracy_score(y, preds)
         self.last_train_count = len(df)
+        self._loaded = True  # fresh model supersedes the saved one
         self._save()
         # Clear probability cache after retrain (model changed)
         self._prob_cache.clear()
@@ -113,6 +125,7 @@ class TradeOutcomeModel:
         return True
 
     def predict_success_probability(self, signal: Dict[str, Any]) -> Optional[float]:
+        self._load()
         if not self.model or not self.scaler:
             return None
         try:
@@ -148,8 +161,11 @@ class TradeOutcomeModel:
 # Singleton accessor
 _ml_instance: Optional[TradeOutcomeModel] = None
 
-def get_ml_model() -> TradeOutcomeModel:
+def get_ml_model() -> Optional[TradeOutcomeModel]:
+    """Shared model instance, or None when scikit-learn/joblib are not installed"""
     global _ml_instance
+    if not ML_LIBS_AVAILABLE:
+        return None
     if _ml_instance is None:
         _ml_instance = TradeOutcomeModel()
     return _ml_instance
@@ -35,19 +35,22 @@ import os
 import json
 import requests
 import time
+import hashlib
+from concurrent.futures import Future
 from typing import Optional, Dict, Any
 from datetime import datetime, timedelta
 from collections import deque
-from threading import Lock
+from threading import BoundedSemaphore, Lock
 
 # Import config for rate limits
 try:
-    from config import get_llm_limits, LLM_USAGE_FILE
+    from config import get_llm_limits, LLM_USAGE_FILE, LLM_MAX_CONCURRENT_REQUESTS
 except ImportError:
     # Fallback if config.py not available
     def get_llm_limits(provider, model):
         return {'requests_per_day': 1000, 'requests_per_minute': 30}
     LLM_USAGE_FILE = 'llm_usage.json'
+    LLM_MAX_CONCURRENT_REQUESTS = 8
 
 
 class LLMUsageTracker:
@@ -203,6 +206,7 @@ class MultiProviderLLMClient:
                 'api_key': os.getenv('GROQ_API_KEY'),
                 'base_url': 'https://api.groq.com/openai/v1',
                 'model': os.getenv('GROQ_MODEL', 'llama-3.1-8b-instant'),
+                'supports_tools': True,  # OpenAI-style tools/tool_choice
                 'success_count': 0,
                 'error_count': 0,
                 'total_time': 0.0,
@@ -220,6 +224,7 @@ class MultiProviderLLMClient:
                 # Format: https://api.cloudflare.com/client/v4/accounts/{account_id}/ai/v1
                 'base_url': f'https://api.cloudflare.com/client/v4/accounts/{cloudflare_account_id}/ai/v1',
                 'model': '@cf/meta/llama-3.2-3b-instruct',  # Fast 3B model
+                'supports_tools': False,  # Plain prompt; replies use the text format
                 'success_count': 0,
                 'error_count': 0,
                 'total_time': 0.0,
@@ -236,6 +241,15 @@ class MultiProviderLLMClient:
         
         self.lock = Lock()
         
+        # In-flight request coalescing (singleflight): identical concurrent
+        # requests share one upstream call instead of each hitting the API
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = Lock()
+        
+        # Caps concurrent upstream calls when many symbol threads dispatch at once
+        # (keeps bursts under provider rate limits instead of triggering 429s)
+        self._request_slots = BoundedSemaphore(LLM_MAX_CONCURRENT_REQUESTS)
+        
         # Initialize budget tracker
         self.usage_tracker = LLMUsageTracker()
         
@@ -294,7 +308,8 @@ class MultiProviderLLMClient:
             if error_msg:
                 provider['last_error'] = error_msg
     
-    def chat(self, prompt=None, messages=None, temperature=0.7, max_tokens=1000, max_retries=2, timeout=3, **kwargs):
+    def chat(self, prompt=None, messages=None, temperature=0.7, max_tokens=1000, max_retries=2, timeout=3, model=None,
+             tools=None, tool_choice=None, **kwargs):
         """
         Send a chat request to LLM with load balancing and automatic failover.
         
@@ -305,9 +320,12 @@ class MultiProviderLLMClient:
             max_tokens: Maximum tokens to generate
             max_retries: Retry attempts per provider
             timeout: Request timeout in seconds (default: 3 seconds for fast trading)
+            model: Optional Groq model override (other providers keep their own model)
+            tools: Optional OpenAI-style tool definitions for structured output
+            tool_choice: Optional tool_choice forcing a specific tool
             
         Returns:
-            str: LLM response text
+            str: LLM response text (tool-call arguments JSON when the model calls a tool)
             
         Raises:
             Exception: If all providers fail or budget exhausted
@@ -321,6 +339,37 @@ class MultiProviderLLMClient:
         if messages is None:
             raise ValueError("Either 'messages' or 'prompt' must be provided")
 
+        # Coalesce identical in-flight requests (e.g. correlated symbols sharing a news batch)
+        key = hashlib.sha1(json.dumps(
+            [messages, temperature, max_tokens, model, tools, tool_choice], sort_keys=True, default=str
+        ).encode('utf-8')).hexdigest()
+        
+        with self._inflight_lock:
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                future = Future()
+                self._inflight[key] = future
+        
+        if inflight is not None:
+            # Another thread is already running this exact request - wait for its result
+            return inflight.result()
+        
+        try:
+            with self._request_slots:
+                content = self._chat_with_failover(messages, temperature, max_tokens, max_retries, timeout,
+                                                   model, tools, tool_choice)
+            future.set_result(content)
+            return content
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+    
+    def _chat_with_failover(self, messages, temperature, max_tokens, max_retries, timeout, model,
+                            tools=None, tool_choice=None):
+        """Run a chat request across providers with retries (no coalescing)"""
         all_errors = []
         tried_providers = set()
         
@@ -337,8 +386,9 @@ class MultiProviderLLMClient:
             
             tried_providers.add(provider_id)
             provider = self.providers[provider_id]
+            model_name = model if (model and provider_id == 'groq') else provider['model']
             
-            print(f"\n🤖 Trying {provider['name']} ({provider['model']})...")
+            print(f"\n🤖 Trying {provider['name']} ({model_name})...")
             
             # Try this provider with retries
             for retry_attempt in range(max_retries):
@@ -350,15 +400,23 @@ class MultiProviderLLMClient:
                     if provider.get('api_key'):
                         headers['Authorization'] = f"Bearer {provider['api_key']}"
                     
+                    payload = {
+                        'model': model_name,
+                        'messages': messages,
+                        'temperature': temperature,
+                        'max_tokens': max_tokens
+                    }
+                    # Forced tool calls only where supported; others answer the
+                    # prompt in its text format, which callers parse as a fallback
+                    if tools and provider.get('supports_tools'):
+                        payload['tools'] = tools
+                        if tool_choice:
+                            payload['tool_choice'] = tool_choice
+                    
                     response = requests.post(
                         f"{provider['base_url']}/chat/completions",
                         headers=headers,
-                        json={
-                            'model': provider['model'],
-                            'messages': messages,
-                            'temperature': temperature,
-                            'max_tokens': max_tokens
-                        },
+                        json=payload,
                         timeout=timeout
                     )
                     
@@ -370,17 +428,23 @@ class MultiProviderLLMClient:
                         # Parse OpenAI-compatible response format
                         # Standard format: data['choices'][0]['message']['content']
                         if isinstance(data, dict) and 'choices' in data and data['choices']:
-                            content = data['choices'][0]['message']['content']
+                            message = data['choices'][0]['message']
+                            tool_calls = message.get('tool_calls')
+                            if tool_calls:
+                                # Structured output: return the tool arguments (JSON string)
+                                content = tool_calls[0]['function']['arguments']
+                            else:
+                                content = message['content']
                         else:
                             # If response doesn't match OpenAI format, log and raise error
                             raise Exception(f"Unexpected response format from {provider['name']}: {str(data)[:200]}")
                         
                         # Record successful request
-                        self.usage_tracker.record_request(provider_id, provider['model'])
+                        self.usage_tracker.record_request(provider_id, model_name)
                         self._mark_provider_success(provider_id, elapsed)
                         
                         # Show updated budget
-                        budget = self.usage_tracker.get_remaining_budget(provider_id, provider['model'])
+                        budget = self.usage_tracker.get_remaining_budget(provider_id, model_name)
                         print(f"✓ {provider['name']} responded in {elapsed:.2f}s (Daily: {budget['used_today']}/{budget['limits']['requests_per_day']})")
                         
                         return content
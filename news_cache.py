@@ -8,6 +8,7 @@ import os
 from datetime import datetime, timedelta
 from typing import Dict, List, Set, Tuple, Optional
 import hashlib
+import re
 import threading
 
 
@@ -193,6 +194,27 @@ class NewsCache:
         }
 
 
+_TITLE_NOISE_RE = re.compile(r'[\W_]+')
+
+
+def dedupe_articles(articles: List[Dict]) -> List[Dict]:
+    """
+    Drop repeated headlines (same story syndicated across feeds), keeping the
+    first occurrence. Titles are compared lowercased with punctuation and
+    whitespace removed; articles without a title are always kept.
+    """
+    seen = set()
+    unique = []
+    for article in articles:
+        key = _TITLE_NOISE_RE.sub('', (article.get('title') or '').lower())
+        if key:
+            if key in seen:
+                continue
+            seen.add(key)
+        unique.append(article)
+    return unique
+
+
 def sort_articles_by_time(articles: List[Dict]) -> List[Dict]:
     """
     Sort articles by publication time (newest first)
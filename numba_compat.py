@@ -0,0 +1,22 @@
+"""
+Optional Numba JIT support
+Numeric hot paths are decorated with `njit`; without numba installed the
+decorator is a no-op and the plain Python functions are used unchanged.
+
+Kernels called from the threaded analysis fan-out pass an explicit signature
+(`@njit("float64(float64[:])", cache=True)`) so they are compiled - or loaded
+from the on-disk cache - at import, not on the first call inside a worker.
+"""
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (supports @njit and @njit(...))"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
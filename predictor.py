@@ -1,4 +1,5 @@
 import json
+import re
 from typing import Any, Dict, Optional
 from datetime import datetime
 
@@ -17,6 +18,10 @@ from config import (
     ML_MIN_CONFIDENCE
 )
 
+# First probability-looking number in an LLM reply
+_PROBABILITY_RE = re.compile(r"(0\.[0-9]+|1\.0|1|0)")
+
+
 class ProbabilityPredictor:
     """Abstraction layer providing trade success probability.
     Uses local ML model if trained, otherwise falls back to LLM classification.
@@ -49,8 +54,7 @@ class ProbabilityPredictor:
         try:
             raw = self.llm_client.chat(prompt=prompt, temperature=0.2, max_tokens=40)
             # Extract first float
-            import re
-            m = re.search(r"(0\.[0-9]+|1\.0|1|0)", raw)
+            m = _PROBABILITY_RE.search(raw)
             if m:
                 val = float(m.group(1))
                 # Normalize if an integer 0/1 returned
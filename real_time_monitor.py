@@ -8,7 +8,6 @@ import os
 import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
-import yfinance as yf
 from collections import defaultdict
 
 class TradeMonitor:
@@ -89,6 +88,8 @@ class TradeMonitor:
         Update current prices for all active positions
         Returns list of positions with alerts
         """
+        import yfinance as yf
+
         alerts = []
         
         for position in self.positions:
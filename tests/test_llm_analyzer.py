@@ -0,0 +1,79 @@
+import json
+
+import pytest
+
+from llm_analyzer import CryptoMarketAnalyzer, _weight_bucket
+
+PARSE_ERROR = {"llm_available": False, "parse_error": True}
+
+
+@pytest.fixture
+def analyzer(monkeypatch, tmp_path):
+    """Analyzer with no LLM client and no learning state on disk."""
+    monkeypatch.chdir(tmp_path)
+    return CryptoMarketAnalyzer()
+
+
+def test_parse_tool_call_payload(analyzer):
+    payload = json.dumps(
+        {
+            "direction": "long",
+            "confidence": 72,
+            "reasoning": "  Breakout on volume  ",
+            "risk": "low",
+            "timeframe": "hours",
+        }
+    )
+
+    assert analyzer._parse_llm_response(payload) == {
+        "direction": "LONG",
+        "confidence": 72,
+        "reasoning": "Breakout on volume",
+        "risk": "LOW",
+        "timeframe": "HOURS",
+    }
+
+
+def test_parse_text_fallback_with_multiline_reasoning(analyzer):
+    response = (
+        "**DIRECTION:** SHORT\n"
+        "CONFIDENCE: 64%\n"
+        "REASONING: Rejected at resistance.\n"
+        "Funding is stretched.\n"
+        "RISK: HIGH\n"
+        "TIMEFRAME: DAYS\n"
+    )
+
+    assert analyzer._parse_llm_response(response) == {
+        "direction": "SHORT",
+        "confidence": 64,
+        "reasoning": "Rejected at resistance.\nFunding is stretched.",
+        "risk": "HIGH",
+        "timeframe": "DAYS",
+    }
+
+
+def test_parse_text_fallback_defaults_optional_fields(analyzer):
+    parsed = analyzer._parse_llm_response("DIRECTION: NEUTRAL\nCONFIDENCE: 40")
+
+    assert parsed["risk"] == "MEDIUM" and parsed["timeframe"] == "HOURS"
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        "DIRECTION: LONG\nCONFIDENCE: 150\nREASONING: too sure",
+        "DIRECTION: SIDEWAYS\nCONFIDENCE: 60\nREASONING: unknown direction",
+        "CONFIDENCE: 60\nREASONING: no direction at all",
+        json.dumps({"direction": "LONG", "confidence": -5}),
+        json.dumps({"direction": "UP", "confidence": 60}),
+    ],
+)
+def test_parse_malformed_reply_is_rejected(analyzer, response):
+    assert analyzer._parse_llm_response(response) == PARSE_ERROR
+
+
+def test_weight_bucket_boost_needs_strictly_positive_profit():
+    assert _weight_bucket(0.70, 0.0) == (1.2, "✅ GOOD")
+    assert _weight_bucket(0.70, 0.001)[0] == 1.5
+    assert _weight_bucket(0.10, 5.0)[0] == 0.3
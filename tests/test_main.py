@@ -77,7 +77,7 @@ class FakeSocialMonitor:
 
 
 @pytest.fixture(autouse=True)
-def reset_main_state(monkeypatch):
+def reset_main_state(monkeypatch, tmp_path):
     """
     Ensure that we don't use a real yfinance client and replace the LLM client
     and other global dependencies with safe fakes. PyTest will use this fixture
@@ -98,17 +98,17 @@ def reset_main_state(monkeypatch):
 
     # Replace Social Media Monitor to avoid API calls and rate limits
     monkeypatch.setattr(m, "SocialMediaMonitor", FakeSocialMonitor)
+    m.clear_social_cache()
 
-    # Ensure cached functions are cleared if previously used
-    try:
-        m.get_market_data.cache_clear()
-    except Exception:
-        # Not fatal; cache may not exist in some contexts
-        pass
+    # Keep the market data cache out of the working directory and start empty
+    monkeypatch.setattr(m, "MARKET_DATA_CACHE_FILE", str(tmp_path / "market_cache.json"))
+    m.clear_market_cache()
 
     yield
 
-    # No special teardown required; monkeypatch will revert global monkeypatches
+    # Drop entries stored during the test so the atexit save has nothing to write
+    m.clear_market_cache()
+    m.clear_social_cache()
 
 
 def test_get_market_data_returns_expected_keys_and_types(monkeypatch):
@@ -118,7 +118,7 @@ def test_get_market_data_returns_expected_keys_and_types(monkeypatch):
     """
     # Call the function under test
     symbol = "BTC-USD"
-    m.get_market_data.cache_clear()
+    m.clear_market_cache()
     result = m.get_market_data(symbol)
 
     assert isinstance(result, dict), "get_market_data should return a dictionary"
@@ -210,3 +210,121 @@ def test_analyze_sentiment_with_llm_returns_none_if_no_llm(monkeypatch):
     score, reason = result
     assert score is None, "Should return None when the LLM client is not available"
     assert isinstance(reason, str) and "AI unavailable" in reason
+
+
+def run_trade_check(monkeypatch, bars):
+    """
+    Run check_trade_outcomes on one LONG BTC trade (entry 100, SL 98, TP 103)
+    opened 5h ago, against hourly (high, low) bars that start 30 minutes after
+    the entry. Returns the trade as written back to the log.
+    """
+    entry_time = pd.Timestamp.now(tz="UTC").floor("s") - pd.Timedelta(hours=5)
+    trade = {
+        "timestamp": entry_time.isoformat(),
+        "check_time": (entry_time + pd.Timedelta(hours=2)).isoformat(),
+        "symbol": "BTC",
+        "direction": "LONG",
+        "entry_price": 100.0,
+        "stop_loss": 98.0,
+        "take_profit": 103.0,
+        "leverage": 1,
+        "status": "open",
+    }
+    idx = pd.date_range(
+        start=entry_time + pd.Timedelta(minutes=30), periods=len(bars), freq="h"
+    )
+    highs = [h for h, _ in bars]
+    lows = [low for _, low in bars]
+    frame = pd.DataFrame(
+        {"High": highs, "Low": lows, "Close": [100.5] * len(bars)}, index=idx
+    )
+    written = []
+    monkeypatch.setattr(m, "load_trade_log", lambda: [trade])
+    monkeypatch.setattr(m, "write_trade_log", lambda trades: written.extend(trades))
+    monkeypatch.setattr(
+        m, "prefetch_market_data", lambda symbols, period, interval: {"BTC-USD": frame}
+    )
+    monkeypatch.setattr(m, "market_analyzer", None)
+    m.check_trade_outcomes()
+    assert len(written) == 1
+    return written[0]
+
+
+def test_check_trade_outcomes_sl_hit_first(monkeypatch):
+    """A stop touched before the target closes the trade as stopped"""
+    trade = run_trade_check(monkeypatch, [(101, 99.5), (100, 97.5), (104, 100)])
+    assert trade["status"] == "stopped"
+    assert trade["exit_price"] == 98.0
+
+
+def test_check_trade_outcomes_tp_hit_first(monkeypatch):
+    """A target touched before the stop closes the trade as completed"""
+    trade = run_trade_check(monkeypatch, [(101, 99.5), (103.5, 100), (101, 97)])
+    assert trade["status"] == "completed"
+    assert trade["exit_price"] == 103.0
+
+
+def test_check_trade_outcomes_same_bar_resolves_to_sl(monkeypatch):
+    """SL and TP in the same bar: intrabar order is unknown, the stop wins"""
+    trade = run_trade_check(monkeypatch, [(101, 99.5), (104, 97)])
+    assert trade["status"] == "stopped"
+
+
+def test_check_trade_outcomes_ignores_touches_before_entry(monkeypatch):
+    """A TP touch before the entry fills does not count as a win"""
+    trade = run_trade_check(monkeypatch, [(104, 101), (101, 99.5), (101, 99)])
+    assert trade["status"] == "checked"
+    assert trade["entry_reached"] is True
+
+
+@pytest.mark.parametrize(
+    "pub_date, expected",
+    [
+        ("2025-01-01T11:59:59Z", True),
+        ("2025-01-01T12:00:01Z", False),
+        ("2025-01-01T13:59:59+02:00", True),  # 11:59:59 UTC
+        ("2025-01-01T11:59:59.500Z", True),
+        ("2025-01-01T12:00:00.500+00:00", False),
+        ("not a date", False),
+        (None, False),
+    ],
+)
+def test_published_before_handles_offsets_and_fractions(pub_date, expected):
+    cutoff = pd.Timestamp("2025-01-01T12:00:00Z").to_pydatetime()
+    assert m._published_before(pub_date, cutoff, "2025-01-01T12:00:00Z") is expected
+
+
+def test_compute_market_features_prices_off_last_valid_close():
+    """A NaN-padded trailing bar (batched download) must not become the price"""
+    df = create_sample_ohlcv(120)
+    last_valid = float(df["Close"].iloc[-2])
+    df.iloc[-1] = np.nan
+
+    result = m.compute_market_features(df, "BTC-USD")
+
+    assert result["price"] == last_valid
+
+
+def test_parse_rss_items_plain_and_namespaced_feeds():
+    """RSS 2.0 items and RSS 1.0/RDF items (namespaced) are both extracted"""
+    plain = (
+        b'<?xml version="1.0"?><rss version="2.0"><channel><title>Feed</title>'
+        b"<item><title>BTC rallies</title>"
+        b"<description><![CDATA[<p>Up <b>5%</b></p>]]></description></item>"
+        b"</channel></rss>"
+    )
+    namespaced = (
+        b'<?xml version="1.0"?>'
+        b'<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#" '
+        b'xmlns="http://purl.org/rss/1.0/">'
+        b"<channel><title>Feed</title></channel>"
+        b"<item><title>ETH upgrade ships</title><description>Gas drops</description></item>"
+        b"</rdf:RDF>"
+    )
+
+    assert m._parse_rss_items(plain) == [
+        {"title": "BTC rallies", "description": "Up 5%"}
+    ]
+    assert m._parse_rss_items(namespaced) == [
+        {"title": "ETH upgrade ships", "description": "Gas drops"}
+    ]
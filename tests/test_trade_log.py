@@ -0,0 +1,82 @@
+import json
+import os
+
+import pytest
+
+import trade_log as tl
+
+
+@pytest.fixture(autouse=True)
+def isolated_log(monkeypatch, tmp_path):
+    """Run every test in an empty directory with a cold parse cache."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(tl, "_CACHE", {})
+    yield
+
+
+def test_load_missing_log_raises():
+    with pytest.raises(FileNotFoundError):
+        tl.load_trade_log()
+
+
+def test_append_then_load_round_trip():
+    tl.append_trade({"symbol": "BTC", "status": "open"})
+    tl.append_trade({"symbol": "ETH", "status": "open"})
+
+    assert [t["symbol"] for t in tl.load_trade_log()] == ["BTC", "ETH"]
+    with open(tl.TRADE_LOG_FILE) as f:
+        assert f.read().splitlines()[0] == '{"symbol":"BTC","status":"open"}'
+
+
+def test_legacy_json_log_is_read_and_migrated_on_first_append():
+    legacy = [{"symbol": "BTC", "status": "completed"}]
+    with open(tl.LEGACY_TRADE_LOG_FILE, "w") as f:
+        json.dump(legacy, f, indent=2)
+
+    # Read falls back to the legacy array until the first append
+    assert tl.load_trade_log() == legacy
+    assert not os.path.exists(tl.TRADE_LOG_FILE)
+
+    tl.append_trade({"symbol": "ETH", "status": "open"})
+
+    with open(tl.TRADE_LOG_FILE) as f:
+        lines = [json.loads(line) for line in f]
+    assert lines == legacy + [{"symbol": "ETH", "status": "open"}]
+
+
+def test_torn_and_blank_lines_are_skipped():
+    with open(tl.TRADE_LOG_FILE, "w") as f:
+        f.write('{"symbol":"BTC"}\n\n{"symbol":"ETH"}\n{"symbol":"SO')
+
+    assert [t["symbol"] for t in tl.load_trade_log()] == ["BTC", "ETH"]
+
+
+def test_write_replaces_log_atomically():
+    tl.append_trade({"symbol": "BTC", "status": "open"})
+    trades = tl.load_trade_log()
+    trades[0]["status"] = "stopped"
+
+    tl.write_trade_log(trades)
+
+    assert not os.path.exists(tl.TRADE_LOG_FILE + ".tmp")
+    assert tl.load_trade_log() == [{"symbol": "BTC", "status": "stopped"}]
+
+
+def test_cache_sees_own_appends_and_external_writes():
+    tl.append_trade({"symbol": "BTC"})
+    assert len(tl.load_trade_log()) == 1  # primes the cache
+
+    tl.append_trade({"symbol": "ETH"})
+    assert [t["symbol"] for t in tl.load_trade_log()] == ["BTC", "ETH"]
+
+    # Another process appending changes the file stat and forces a re-parse
+    with open(tl.TRADE_LOG_FILE, "a") as f:
+        f.write('{"symbol":"SOL"}\n')
+    assert [t["symbol"] for t in tl.load_trade_log()] == ["BTC", "ETH", "SOL"]
+
+
+def test_loaded_trades_are_copies():
+    tl.append_trade({"symbol": "BTC", "status": "open"})
+    tl.load_trade_log()[0]["status"] = "changed"
+
+    assert tl.load_trade_log()[0]["status"] == "open"
@@ -0,0 +1,93 @@
+"""
+Trade Log Storage - append-only JSON Lines file
+One trade per line: logging a trade is a single append (no read/rewrite of
+the whole history). Status updates rewrite the file once per check run.
+The parsed log is kept in memory and reused while the file is unchanged, so
+the several reads of one run parse it once.
+"""
+
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+
+from config import TRADE_LOG_FILE
+
+# Pre-JSONL log (single JSON array); read when the .jsonl file does not exist yet
+LEGACY_TRADE_LOG_FILE = 'trade_log.json'
+
+_SEPARATORS = (',', ':')
+
+# Parsed log per path: {path: ((mtime_ns, size), trades)}; valid while the stat matches
+_CACHE: Dict[str, Tuple[Tuple[int, int], List[Dict]]] = {}
+
+
+def _stat_key(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _cached(path: str) -> Optional[List[Dict]]:
+    """Cached trades for path if the file has not changed since they were stored"""
+    entry = _CACHE.get(path)
+    if entry is not None and entry[0] == _stat_key(path):
+        return entry[1]
+    return None
+
+
+def _store(path: str, trades: List[Dict]):
+    key = _stat_key(path)
+    if key is not None:
+        _CACHE[path] = (key, trades)
+
+
+def load_trade_log(path: str = TRADE_LOG_FILE) -> List[Dict]:
+    """
+    Load all trades. Raises FileNotFoundError when no log exists yet.
+    A torn trailing line (crash mid-append) is skipped.
+    Callers get their own trade dicts and may modify them freely.
+    """
+    cached = _cached(path)
+    if cached is not None:
+        return [dict(t) for t in cached]
+
+    if not os.path.exists(path) and path == TRADE_LOG_FILE and os.path.exists(LEGACY_TRADE_LOG_FILE):
+        with open(LEGACY_TRADE_LOG_FILE, 'r') as f:
+            return json.load(f)
+
+    trades = []
+    with open(path, 'r') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                trades.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    _store(path, trades)
+    return [dict(t) for t in trades]
+
+
+def append_trade(trade: Dict, path: str = TRADE_LOG_FILE):
+    """Append one trade (O(1) - no parse or rewrite of existing entries)"""
+    if not os.path.exists(path) and path == TRADE_LOG_FILE and os.path.exists(LEGACY_TRADE_LOG_FILE):
+        # First write after upgrading: carry the legacy history over
+        write_trade_log(load_trade_log(path) + [trade], path)
+        return
+    cached = _cached(path)
+    with open(path, 'a') as f:
+        f.write(json.dumps(trade, separators=_SEPARATORS) + '\n')
+    if cached is not None:
+        # Cache was current before the append - extend it instead of re-reading
+        _store(path, cached + [dict(trade)])
+
+
+def write_trade_log(trades: List[Dict], path: str = TRADE_LOG_FILE):
+    """Rewrite the whole log (after status updates) via temp file + atomic rename"""
+    tmp_file = path + '.tmp'
+    with open(tmp_file, 'w') as f:
+        f.writelines(json.dumps(t, separators=_SEPARATORS) + '\n' for t in trades)
+    os.replace(tmp_file, path)
+    _store(path, [dict(t) for t in trades])